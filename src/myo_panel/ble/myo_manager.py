@@ -9,9 +9,11 @@ code removed, and with constants pulled in from *myo_constants.py*.
 
 from __future__ import annotations
 
-import asyncio, threading, time
+import asyncio, concurrent.futures, threading, time
 from typing import Callable, Dict, List, Optional
 
+import numpy as np
+
 from bleak import BleakClient, BleakScanner   # pip install bleak
 
 from . import myo_constants as C
@@ -34,6 +36,9 @@ def run_async(coro, timeout=None):          # blocking helper
 def fire_and_forget(coro):    # schedule without awaiting
     asyncio.run_coroutine_threadsafe(coro, _bg_loop)
 
+async def await_bg(coro):     # await from another loop (e.g. the Qt one)
+    return await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(coro, _bg_loop))
+
 # For clean shutdown
 def stop_bg_loop():
     """Stop the background event loop and clean up resources."""
@@ -63,8 +68,9 @@ class MyoManager:
     def __init__(
         self,
         *,
-        emg_handler: Optional[Callable[[int, List[List[int]]], None]] = None,
+        emg_handler: Optional[Callable[[int, Optional[np.ndarray], int, bytearray], None]] = None,
         imu_handler: Optional[Callable[[List[float], List[int], List[int], str], None]] = None,
+        emg_frames_handler: Optional[Callable[[int, np.ndarray], None]] = None,
     ) -> None:
         self._client: Optional[BleakClient] = None
         self._lock = asyncio.Lock()
@@ -76,9 +82,12 @@ class MyoManager:
         self._fw = None
         self._last_error: Optional[str] = None
         self._emg_handler, self._imu_handler = emg_handler, imu_handler
+        # EMG callbacks get arrays / buffers that are only valid during the call
+        self._emg_frames_handler = emg_frames_handler  # (bank, (2, 8) int8 frames), for plotting
         self._shutting_down = False # Flag to indicate shutdown
         self.model_names = MYO_MODEL_NAMES
         self._connection_changed_callback = None  # Callback for connection state changes
+        self._stop_future = None  # Pending shutdown disconnect, see request_stop()
 
     # ── synchronous wrappers ─────────────────────────────────────────────
     def scan(self) -> List[Dict[str, str]]:
@@ -90,26 +99,71 @@ class MyoManager:
 
     def connect(self, address: str, *, emg_mode: int = 3, imu_mode: int = 1) -> None:
         """Blocking connect & start streaming."""
+        cmd = self._prepare_connect(emg_mode, imu_mode)
+        try:
+            # This can still block if _connect doesn't timeout properly
+            run_async(self._connect(address, cmd))
+        except Exception as e:
+            err = self._connect_failed(address, e)
+            if err is e:
+                raise  # Propagate original error
+            raise err from e
+
+    # ── awaitable wrappers (run on the background loop, awaited from the caller's) ──
+    async def scan_async(self, timeout: Optional[float] = None) -> List[Dict[str, str]]:
+        """Like scan(), but awaitable instead of blocking the calling loop.
+
+        *timeout* is enforced on the background loop and raises
+        asyncio.TimeoutError in the caller.
+        """
+        if self._shutting_down:
+            print("[MyoManager] Scan called during shutdown, ignoring.")
+            return []
+        return await await_bg(asyncio.wait_for(self._scan(), timeout))
+
+    async def connect_async(self, address: str, *, emg_mode: int = 3, imu_mode: int = 1,
+                            timeout: Optional[float] = None) -> None:
+        """Like connect(), but awaitable; cancelling it aborts the connect.
+
+        *timeout* is enforced on the background loop; on expiry the device is
+        disconnected again and asyncio.TimeoutError is raised.
+        """
+        cmd = self._prepare_connect(emg_mode, imu_mode)
+        try:
+            await await_bg(asyncio.wait_for(self._connect(address, cmd), timeout))
+        except asyncio.CancelledError:
+            self._abort_connect()
+            raise
+        except Exception as e:
+            err = self._connect_failed(address, e)
+            if err is e:
+                raise  # Propagate original error
+            raise err from e
+
+    def _prepare_connect(self, emg_mode: int, imu_mode: int) -> bytearray:
         if self._shutting_down:
             print("[MyoManager] Connect called during shutdown, ignoring.")
             raise ConnectionAbortedError("Shutdown in progress")
         self._emg_mode = emg_mode
         self._imu_mode = imu_mode
-        cmd = bytearray([0x01, 3, emg_mode, imu_mode, 0x00])
-        try:
-            # This can still block if _connect doesn't timeout properly
-            run_async(self._connect(address, cmd))
-        except Exception as e:
-            # Ensure we're fully disconnected on any error
-            fire_and_forget(self._disconnect(silent=True))
-            # Convert common BLE errors to more user-friendly messages
-            if "not found" in str(e).lower() or "no device" in str(e).lower():
-                raise ConnectionError(f"Device {address} was not found") from e
-            elif "timeout" in str(e).lower():
-                raise ConnectionError(f"Connection to device {address} timed out") from e
-            else:
-                # Propagate original error
-                raise
+        return bytearray([0x01, 3, emg_mode, imu_mode, 0x00])
+
+    def _abort_connect(self) -> None:
+        """Tear down a connect that was cancelled, timed out or failed."""
+        # Once _connect has reported (True, "connected") the UI must also hear
+        # about the disconnect, otherwise it keeps showing a dead link as live
+        fire_and_forget(self._disconnect(silent=not self._connected))
+
+    def _connect_failed(self, address: str, e: Exception) -> Exception:
+        """Clean up after a failed connect and return the error to raise."""
+        # Ensure we're fully disconnected on any error
+        self._abort_connect()
+        # Convert common BLE errors to more user-friendly messages
+        if "not found" in str(e).lower() or "no device" in str(e).lower():
+            return ConnectionError(f"Device {address} was not found")
+        elif "timeout" in str(e).lower():
+            return ConnectionError(f"Connection to device {address} timed out")
+        return e
 
     def update_modes(self, emg_mode: int = None, imu_mode: int = None) -> None:
         """Update EMG and IMU modes on a connected device."""
@@ -131,13 +185,19 @@ class MyoManager:
     def deep_sleep_async(self):
         if self._shutting_down: return # Added shutdown check
         fire_and_forget(self._deep_sleep())
-    def refresh_battery_async(self) -> None:
+    def refresh_battery_async(self, on_done: Optional[Callable[[Optional[int]], None]] = None) -> None:
+        """Read the battery level; *on_done(level)* runs on the bg loop once it is in."""
         if self._shutting_down: return # Added shutdown check
         if self._connected:
-            fire_and_forget(self._read_battery())
+            fire_and_forget(self._refresh_battery(on_done))
 
-    def shutdown(self, timeout: float = 3.0) -> None:
-        """Initiates shutdown of the MyoManager, attempting a graceful disconnect."""
+    async def _refresh_battery(self, on_done):
+        await self._read_battery()
+        if on_done is not None:
+            on_done(self._battery)
+
+    def request_stop(self) -> None:
+        """Begin shutdown without blocking; pair with join() to wait for it."""
         print("[MyoManager] Shutdown initiated.")
         
         # Already shutting down - avoid duplicate calls
@@ -156,25 +216,42 @@ class MyoManager:
         # 2. Clear connection callback to prevent UI updates during shutdown
         self._connection_changed_callback = None
         
-        # 3. Force client disconnection synchronously if client exists
+        # 3. Disconnect the client on the background loop; join() waits for it
         if self._client:
-            print("[MyoManager] Forcefully disconnecting client during shutdown...")
-            try:
-                # Direct synchronous cleanup - no awaiting
-                self._client = None  # Release the client reference first
-                self._connected = False  # Ensure we're marked as disconnected
-            except Exception as e:
-                print(f"[MyoManager] Error during forceful disconnect: {e}")
+            print("[MyoManager] Disconnecting client during shutdown...")
+            self._connected = False  # Ensure we're marked as disconnected
+            self._stop_future = asyncio.run_coroutine_threadsafe(
+                self._disconnect(silent=True), _bg_loop)
         else:
             print("[MyoManager] No client to disconnect during shutdown.")
         
         # 4. Release all other resources
         self._battery = None
         self._emg_handler = None
+        self._emg_frames_handler = None
         self._imu_handler = None
-        
-        # Set final shutdown state
+
+    def join(self, timeout: Optional[float] = None) -> bool:
+        """Wait up to *timeout* seconds for request_stop() to finish.
+
+        Returns True once the client is released; ``join(0)`` only polls.
+        """
+        fut = self._stop_future
+        if fut is None or fut.done() or not _bg_loop.is_running():
+            return True
+        try:
+            fut.result(timeout)
+        except concurrent.futures.TimeoutError:
+            return False
+        except Exception as e:
+            print(f"[MyoManager] Error during shutdown disconnect: {e}")
         print("[MyoManager] Shutdown complete.")
+        return True
+
+    def shutdown(self, timeout: float = 3.0) -> bool:
+        """Blocking shutdown: request_stop() followed by join(timeout)."""
+        self.request_stop()
+        return self.join(timeout)
 
     # ── public read‑only props ───────────────────────────────────────────
     @property
@@ -400,22 +477,21 @@ class MyoManager:
                 if len(data) == 16:
                     # Use Unix time with nano precision
                     ts = int(time.time() * 1000000)
-                    # Always keep the original bytes for raw mode
-                    raw_hex = "".join(f"{b:02x}" for b in data)
-                    
+
                     # Process data based on EMG mode
                     if self._emg_mode == C.EMG_MODE_NONE:
-                        samples = None  # No processing in NONE mode
+                        frames = None  # No processing in NONE mode
                     else:
-                        # For all other modes, decode the values
-                        # The difference is in what the device sends, not how we parse it
-                        samples = [
-                            [int.from_bytes([b], "little", signed=True) for b in data[:8]],
-                            [int.from_bytes([b], "little", signed=True) for b in data[8:]]
-                        ]
-                    
+                        # For all other modes, decode the values once, as a
+                        # (2, 8) int8 view both consumers share. The difference
+                        # is in what the device sends, not how we parse it
+                        frames = np.frombuffer(data, dtype=np.int8).reshape(2, 8)
+                        if self._emg_frames_handler:
+                            self._emg_frames_handler(bank, frames)
+                    # The original bytes ride along for raw mode; the recorder
+                    # only builds lists / hex strings when it needs them
                     if self._emg_handler:
-                        self._emg_handler(bank, samples, ts, raw_hex)
+                        self._emg_handler(bank, frames, ts, data)
             return h
             
         for i, uuid in enumerate(C.EMG_UUIDS):
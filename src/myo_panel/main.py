@@ -1,5 +1,6 @@
 # main.py  (entry-point for `python -m myo_panel` or `myo-panel` script)
 import sys, asyncio, pathlib, time, atexit, signal, os
+import logging, logging.handlers, queue
 from PySide6.QtWidgets import QApplication, QMessageBox
 from qasync import QEventLoop, asyncSlot
 from .ble.myo_manager import MyoManager, stop_bg_loop
@@ -20,6 +21,18 @@ def cleanup():
         # Force exit as a last resort
         os._exit(0)
 
+def setup_logging(level=logging.INFO):
+    """Route log records through a queue so the GUI and BLE threads never block on stderr."""
+    q = queue.SimpleQueue()
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter("%(levelname)s [%(name)s] %(message)s"))
+    listener = logging.handlers.QueueListener(q, handler)
+    root = logging.getLogger()
+    root.setLevel(level)
+    root.addHandler(logging.handlers.QueueHandler(q))
+    listener.start()  # daemon thread; stop() flushes what is still queued
+    return listener
+
 def signal_handler(sig, frame):
     print(f"Received signal {sig}, initiating shutdown...")
     # Force exit after a timeout
@@ -29,6 +42,8 @@ def signal_handler(sig, frame):
     QApplication.instance().quit()
 
 def main():
+    log_listener = setup_logging()
+
     # Register cleanup functions
     atexit.register(cleanup)
     signal.signal(signal.SIGINT, signal_handler)
@@ -44,22 +59,24 @@ def main():
     win = MainWindow(mgr)
     win.show()
 
-    # bind EMG events to both UI plots and the recording panel
-    def _emg_handler(bank, two_frames, timestamp, raw_hex_from_manager):
-        # Only update UI if EMG mode is not NONE and we have valid frames
-        if mgr._emg_mode != 0 and two_frames is not None:
-            win.on_emg(bank, two_frames)
-            
+    # EMG plots take the decoded frames straight from the manager
+    mgr._emg_frames_handler = win.on_emg_frames
+
+    # bind EMG events to the recording panel
+    def _emg_handler(bank, two_frames, timestamp, data):
+        # Nothing to format unless a recording is running
+        if not win.record_panel.is_recording():
+            return
         # Handle recording based on UI and mode settings
         if win.record_panel.raw_chk.isChecked():
-            # Raw mode is selected in UI: pass raw_hex only if we have it
-            if raw_hex_from_manager:
-                win.record_panel.push_frame(None, timestamp, raw_hex_from_manager)
+            # Raw mode is selected in UI: store the packet as hex
+            win.record_panel.push_frame(None, timestamp, data.hex())
         elif two_frames is not None:
             # Processed mode is selected in UI: pass decoded frames
             # raw_hex argument to push_frame will be None by default
-            win.record_panel.push_frame(two_frames[0], timestamp)
-            win.record_panel.push_frame(two_frames[1], timestamp)
+            first, second = two_frames.tolist()
+            win.record_panel.push_frame(first, timestamp)
+            win.record_panel.push_frame(second, timestamp)
     
     mgr._emg_handler = _emg_handler
 
@@ -87,6 +104,7 @@ def main():
             print("Main event loop closed.")
             # Explicitly call stop_bg_loop to ensure background tasks are stopped
             stop_bg_loop()
+            log_listener.stop()
 
 if __name__ == "__main__":
     main()
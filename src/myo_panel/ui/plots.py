@@ -11,7 +11,7 @@ class _Ring:
     """Shared circular buffer so grid & composite read the same data."""
     def __init__(self, sample_size=DEFAULT_SAMPLES):
         self.sample_size = sample_size
-        self.buf = np.zeros((8, self.sample_size), dtype=np.int16)
+        self.buf = np.zeros((8, self.sample_size), dtype=np.int8)
         self.ptr = 0
         
     def insert(self, frames: np.ndarray):         # frames (8, N)
@@ -23,6 +23,12 @@ class _Ring:
             self.buf[:, self.ptr:] = frames[:, :k]
             self.buf[:, : end % self.sample_size] = frames[:, k:]
         self.ptr = end % self.sample_size
+
+    def ordered(self) -> np.ndarray:              # (8, sample_size), oldest first
+        """All channels unrolled in one pass (a view when nothing has wrapped)."""
+        if self.ptr == 0:
+            return self.buf
+        return np.concatenate((self.buf[:, self.ptr:], self.buf[:, :self.ptr]), axis=1)
         
     def resize(self, new_size):
         """Resize the buffer, preserving as much data as possible."""
@@ -30,7 +36,7 @@ class _Ring:
             return  # No change needed
             
         # Create new buffer
-        new_buf = np.zeros((8, new_size), dtype=np.int16)
+        new_buf = np.zeros((8, new_size), dtype=np.int8)
         
         # Determine how much data to copy
         if self.ptr == 0:
@@ -109,12 +115,15 @@ class EMGGrid(QWidget):
             vb = w.getViewBox()
             vb.setXRange(0, size, padding=0)
 
+    def push_and_refresh(self, frames: np.ndarray):   # frames (8, N)
+        """Append *frames* to the shared ring and redraw in the same pass."""
+        self.ring.insert(frames)
+        self.refresh()
+
     def refresh(self):
+        data = self.ring.ordered()
         for ch, w, ln in self._plots:
-            y = (self.ring.buf[ch] if self.ring.ptr == 0
-                 else np.concatenate((self.ring.buf[ch, self.ring.ptr:],
-                                      self.ring.buf[ch, :self.ring.ptr])))
-            ln.setData(self._x, y, downsample=self._downsample, autoDownsample=False)
+            ln.setData(self._x, data[ch], downsample=self._downsample, autoDownsample=False)
 
 class EMGComposite(QWidget):
     """Single plot with 8 coloured lines + toggleable legend."""
@@ -144,9 +153,12 @@ class EMGComposite(QWidget):
         vb = self._pw.getViewBox()
         vb.setXRange(0, size, padding=0)
 
+    def push_and_refresh(self, frames: np.ndarray):   # frames (8, N)
+        """Append *frames* to the shared ring and redraw in the same pass."""
+        self.ring.insert(frames)
+        self.refresh()
+
     def refresh(self):
+        data = self.ring.ordered()
         for ch, ln in enumerate(self.lines):
-            y = (self.ring.buf[ch] if self.ring.ptr == 0
-                 else np.concatenate((self.ring.buf[ch, self.ring.ptr:],
-                                      self.ring.buf[ch, :self.ring.ptr])))
-            ln.setData(self._x, y, downsample=self._downsample, autoDownsample=False)
+            ln.setData(self._x, data[ch], downsample=self._downsample, autoDownsample=False)
@@ -4,12 +4,17 @@ from PySide6.QtWidgets import (
     QCheckBox, QPushButton, QSpinBox, QHBoxLayout,
     QFileDialog, QComboBox, QRadioButton, QButtonGroup
 )
-from PySide6.QtCore import QTimer
+from PySide6.QtCore import QTimer, Signal
 import datetime, os, csv, pickle
 import time
 import numpy as np
 
+IMU_COLUMNS = (("quat", 4), ("acc", 3), ("gyro", 3))
+IMU_INITIAL_CAPACITY = 1024  # samples; doubled whenever it fills up
+
 class RecordingPanel(QGroupBox):
+    about_to_stop = Signal()  # Emitted before the last samples are saved
+
     def __init__(self, myo_manager, parent=None):
         super().__init__(parent)
         self.myo = myo_manager
@@ -17,11 +22,7 @@ class RecordingPanel(QGroupBox):
 
         # buffer for CSV export and IMU samples
         self._recording = []  # Main recording buffer
-        self._last_imu = {    # Cache the latest IMU data
-            "quat": None,
-            "acc": None,
-            "gyro": None
-        }
+        self._reset_imu()     # IMU samples, one NumPy column per field
 
         # Path field and browse button
         path_layout = QHBoxLayout()
@@ -122,53 +123,51 @@ class RecordingPanel(QGroupBox):
         else:
             self._start_recording()
 
+    def is_recording(self):
+        return self._active
+
     def _start_recording(self):
         self._recording = []
-        self._last_imu = {
-            "quat": None,
-            "acc": None,
-            "gyro": None
-        }
+        self._reset_imu()
         self._active = True
         self.rec_indicator.setVisible(True)
         
         # Start vision recording if enabled
         if self.enable_vision_chk.isChecked():
             # Get the parent window to access vision recorder
-            parent = self.window()
-            if parent and hasattr(parent, "vision_recording") and parent.vision_recording:
+            vision = getattr(self.window(), "vision_recording", None)
+            if vision:
                 try:
                     # Safely call _start_recording method if it exists
-                    if hasattr(parent.vision_recording, "_start_recording"):
-                        parent.vision_recording._start_recording()
+                    if hasattr(vision, "_start_recording"):
+                        vision._start_recording()
                     else:
                         print("[Recorder] Warning: vision_recording has no _start_recording method")
                 except Exception as e:
                     print(f"[Recorder] Error starting vision recording: {e}")
 
     def _stop_recording(self):
+        self.about_to_stop.emit()  # Lets the window flush IMU samples it still holds
         self._active = False
         self.rec_indicator.setVisible(False)
         
         # Stop vision recording if it was started
-        parent = self.window()
-        if parent and hasattr(parent, "vision_recording") and parent.vision_recording:
-            # Check if recording attribute exists first
-            if hasattr(parent.vision_recording, "recording") and parent.vision_recording.recording:
-                try:
-                    # Safely call _stop_recording method
-                    if hasattr(parent.vision_recording, "_stop_recording"):
-                        parent.vision_recording._stop_recording()
-                    else:
-                        print("[Recorder] Warning: vision_recording has no _stop_recording method")
-                except Exception as e:
-                    print(f"[Recorder] Error stopping vision recording: {e}")
+        vision = getattr(self.window(), "vision_recording", None)
+        if vision and getattr(vision, "recording", False):
+            try:
+                # Safely call _stop_recording method
+                if hasattr(vision, "_stop_recording"):
+                    vision._stop_recording()
+                else:
+                    print("[Recorder] Warning: vision_recording has no _stop_recording method")
+            except Exception as e:
+                print(f"[Recorder] Error stopping vision recording: {e}")
                 
         self._save_file()
 
     def push_frame(self, frame: list[int], timestamp=None, raw_hex=None):
         """Called by the UI to record one EMG frame."""
-        if not getattr(self, "_active", False):
+        if not self._active:
             return
         ts = timestamp or int(time.time() * 1000000)
         label = self.gesture_edit.text().strip() or "unlabeled"
@@ -176,11 +175,11 @@ class RecordingPanel(QGroupBox):
         # Get vision data if enabled
         vision_data = None
         if self.enable_vision_chk.isChecked():
-            parent = self.window()
-            if parent and hasattr(parent, "vision_recording") and parent.vision_recording:
+            vision = getattr(self.window(), "vision_recording", None)
+            if vision:
                 try:
                     # Get latest landmarks data from the vision_recording
-                    landmarks = parent.vision_recording.get_latest_landmarks()
+                    landmarks = vision.get_latest_landmarks()
                     # Process landmarks into a more structured format for CSV export
                     if landmarks and "hands" in landmarks and landmarks["hands"]:
                         vision_data = landmarks
@@ -201,33 +200,78 @@ class RecordingPanel(QGroupBox):
             self._recording.append({
                 "timestamp": ts,
                 "emg": frame.copy(),
-                "imu": self._last_imu.copy(),
+                "imu": None,  # Filled in from the IMU columns by _attach_imu()
                 "label": label,
                 "vision": vision_data
             })
 
-    def push_imu(self, quat, acc, gyro, timestamp=None, raw_hex=None):
-        """Called by the UI to record one IMU sample."""
-        if not getattr(self, "_active", False):
+    def push_imu_batch(self, timestamps, quats, accs, gyros, raws):
+        """Record a burst of IMU samples, given as one sequence per field."""
+        if not self._active or not timestamps:
             return
-        ts = timestamp or int(time.time() * 1000000)
-        label = self.gesture_edit.text().strip() or "unlabeled"
+        k = len(timestamps)
+        now = int(time.time() * 1000000)
+        ts = [t or now for t in timestamps]
+        n = self._imu_n
+        self._reserve_imu(n + k)
+        self._imu_ts[n:n + k] = ts
+        for (name, width), values in zip(IMU_COLUMNS, (quats, accs, gyros)):
+            col = self._imu[name]
+            if all(v is not None for v in values):
+                col[n:n + k] = values
+            else:
+                col[n:n + k] = [v if v is not None else (np.nan,) * width for v in values]
+        self._imu_n = n + k
 
-        # Update last IMU state
-        self._last_imu = {
-            "quat": list(quat) if quat is not None else None,
-            "acc": list(acc) if acc is not None else None,
-            "gyro": list(gyro) if gyro is not None else None
-        }
+        if self.raw_chk.isChecked():
+            label = self.gesture_edit.text().strip() or "unlabeled"
+            for t, raw_hex in zip(ts, raws):
+                if raw_hex:
+                    # Store raw hex data
+                    self._recording.append({
+                        "timestamp": t,
+                        "type": "IMU",
+                        "raw_hex": raw_hex,
+                        "label": label
+                    })
 
-        if self.raw_chk.isChecked() and raw_hex:
-            # Store raw hex data
-            self._recording.append({
-                "timestamp": ts,
-                "type": "IMU",
-                "raw_hex": raw_hex,
-                "label": label
-            })
+    def _reset_imu(self):
+        self._imu_n = 0
+        self._imu_ts = np.empty(IMU_INITIAL_CAPACITY, dtype=np.int64)
+        self._imu = {name: np.empty((IMU_INITIAL_CAPACITY, width))
+                     for name, width in IMU_COLUMNS}
+
+    def _reserve_imu(self, size):
+        cap = len(self._imu_ts)
+        if size <= cap:
+            return
+        while cap < size:
+            cap *= 2
+        n = self._imu_n
+        ts = np.empty(cap, dtype=np.int64); ts[:n] = self._imu_ts[:n]
+        self._imu_ts = ts
+        for name, width in IMU_COLUMNS:
+            col = np.empty((cap, width)); col[:n] = self._imu[name][:n]
+            self._imu[name] = col
+
+    def _attach_imu(self):
+        """Give each processed EMG row the latest IMU sample taken at or before it."""
+        rows = [r for r in self._recording if "emg" in r]
+        if not rows:
+            return
+        n = self._imu_n
+        emg_ts = np.fromiter((r["timestamp"] for r in rows), dtype=np.int64, count=len(rows))
+        # IMU samples can reach us slightly out of order relative to EMG, so
+        # match on timestamps instead of arrival order
+        order = np.argsort(self._imu_ts[:n], kind="stable")
+        idx = np.searchsorted(self._imu_ts[:n][order], emg_ts, side="right") - 1
+        cols = {name: self._imu[name][:n][order] for name, _ in IMU_COLUMNS}
+        for row, i in zip(rows, idx.tolist()):
+            imu = {}
+            for name, _ in IMU_COLUMNS:
+                value = cols[name][i] if i >= 0 else None
+                imu[name] = None if value is None or np.isnan(value).any() else value.tolist()
+            row["imu"] = imu
 
     def _save_file(self):
         directory = self.path_edit.text().strip()
@@ -257,6 +301,11 @@ class RecordingPanel(QGroupBox):
         
         path = os.path.join(directory, filename)
 
+        self._attach_imu()
+        if self.raw_chk.isChecked():
+            # Batched IMU rows are appended after the EMG rows they interleave with
+            self._recording.sort(key=lambda row: row["timestamp"])
+
         meta = {
             "gesture": gesture,
             "limb": limb,
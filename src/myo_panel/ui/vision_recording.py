@@ -24,7 +24,7 @@ except ImportError as e:
             self.use_pose = True
             self.use_hands = True
             
-        def get_available_cameras(self):
+        def get_available_cameras(self, cancel=None):
             return [{"id": 0, "name": "Default"}]
             
         def start(self):
@@ -33,6 +33,9 @@ except ImportError as e:
             
         def stop(self):
             pass
+
+        def stop_if_running(self):
+            return False
             
         def set_camera(self, camera_id):
             pass
@@ -1,30 +1,115 @@
 # windows.py
-from PySide6.QtWidgets import (QMainWindow, QToolBar, QLabel, QStatusBar,
+from PySide6.QtWidgets import (QApplication, QMainWindow, QToolBar, QLabel, QStatusBar,
                                QWidget, QHBoxLayout, QVBoxLayout, QMenu, QToolButton,
-                               QDockWidget)
+                               QDockWidget, QDialog, QInputDialog, QMessageBox)
 from PySide6.QtGui     import QAction, QActionGroup
-from PySide6.QtCore import QTimer, Qt
-import asyncio, numpy as np
+from PySide6.QtCore import (QEvent, QMetaObject, QObject, QRunnable, QThreadPool, QTimer, Qt,
+                            Q_ARG, Signal, Slot)
+import asyncio, importlib, logging, os, signal, numpy as np
+import threading, time
 from collections import deque
-import time
+from functools import partial
 
+from ..ble.myo_manager import stop_bg_loop
 from .plots import _Ring, EMGGrid, EMGComposite, DEFAULT_SAMPLES
 from .recording import RecordingPanel
 from .imu_viz import MatplotlibIMUCube
-# Delay importing VisionRecordingWidget for better startup performance
+# VisionRecordingWidget (OpenCV/MediaPipe) is imported off the GUI thread after
+# startup, see _warm_vision_import
 
-FRAME_UPDATE_INTERVAL   = 100   # ms
-BATTERY_CHECK_INTERVAL  = 5000  # ms
+log = logging.getLogger(__name__)
+
+FRAME_UPDATE_INTERVAL   = 100   # ms, default EMG plot refresh interval
+TICK_INTERVAL           = 100   # ms, master timer for IMU, recording and battery work
+BATTERY_CHECK_INTERVAL  = 5000  # ms, also re-syncs the UI with the connection state
+EMG_FRAME_RATE          = 200   # EMG frames per second from the armband
+EMG_QUEUE_LEN           = 512   # frames buffered between plot refreshes (power of two)
+EMG_QUEUE_MASK          = EMG_QUEUE_LEN - 1
+SHUTDOWN_POLL_INTERVAL  = 50    # ms
+SHUTDOWN_TIMEOUT        = 2.0   # s
+CAMERA_MENU_TTL         = 5.0   # s
+SCAN_TIMEOUT            = 10.0  # s
+CONNECT_TIMEOUT         = 30.0  # s, outlasts MyoManager's own 15 s link timeout plus setup
+
+# Status texts during which _check_connection_status leaves the UI alone
+_ACTIVE_OP_STATES = frozenset({"Turning off…", "Scanning…"})
+# Status texts _update_ui_connection_state treats specially on (dis)connect
+_TIMEOUT_STATES = frozenset({"Connection timed out", "Operation Cancelled"})
+_TRANSIENT_STATES = frozenset({"Disconnecting…", "Connecting…"})
+# Status texts that are stale once data is flowing
+_STALE_CONNECTED_STATES = frozenset({
+    "Connection attempt cancelled - still waiting for device",
+    "Connecting…", "Disconnected", "Operation Cancelled",
+    "Connection timed out - waiting for device (may still connect)",
+})
+
+def _warm_vision_import():
+    """Import the CV View module in the background so the first toggle is fast."""
+    try:
+        importlib.import_module(".vision_recording", __package__)
+    except Exception:
+        # Reported properly by _init_vision_recording if the user enables it
+        log.debug("Pre-importing the CV View module failed", exc_info=True)
+
+class _CameraProbeSignals(QObject):
+    found = Signal(list)
+
+class CameraProbeWorker(QRunnable):
+    """Enumerate cameras on a pool thread; results arrive via signals.found."""
+    def __init__(self, camera_manager, cancel):
+        super().__init__()
+        self.signals = _CameraProbeSignals()
+        self._camera_manager = camera_manager
+        self._cancel = cancel
+
+    def run(self):
+        # Always report back, even on failure: the window only starts a new
+        # probe once this one has delivered its result
+        cameras = []
+        try:
+            cameras = self._camera_manager.get_available_cameras(cancel=self._cancel)
+        except Exception:
+            log.warning("Camera enumeration failed", exc_info=True)
+        finally:
+            if not self._cancel.is_set():
+                self.signals.found.emit(cameras)
 
 class MainWindow(QMainWindow):
+    emg_ready = Signal()  # Emitted from the BLE thread once _emg_chunk frames are pending
+    battery_read = Signal(object)  # Battery level (or None) from the BLE thread
+
     def __init__(self, myo_mgr):
         super().__init__()
         self.myo = myo_mgr
-        self._frame_q = deque(maxlen=500)
+        # Pending EMG frames. Each frame is stored twice, EMG_QUEUE_LEN rows apart,
+        # so the latest frames are always one contiguous slice (no wrap-around copy).
+        # Single producer (BLE thread) / single consumer (GUI thread), no lock:
+        # only on_emg_frames advances _widx, and only after the rows are written;
+        # only the GUI thread touches _ridx.
+        self._frame_buf = np.empty((2 * EMG_QUEUE_LEN, 8), dtype=np.int8)  # samples are int8 on the wire
+        self._widx = 0  # frames written by on_emg_frames
+        self._ridx = 0  # frames consumed by _refresh_plots
         self._ring    = _Ring()
         self._paused  = False
+        self._emg_sink_needed = True  # False while the EMG dock is hidden
+        self._imu_debug_counter = 0
+        self._imu_visible = True   # Mirrors imu_dock visibility, see visibilityChanged
+        self._pending_quat = None  # Latest orientation, drawn on the next tick
+        self._imu_pend = deque()   # (ts, quat, acc, gyro, raw_hex) awaiting the recorder
+        self._split_view = True    # Grid (True) or composite (False) EMG view
+        self._app_visible = True   # False while minimized or hidden by the platform
+        self._app_state_hidden = False
+        app = QApplication.instance()
+        if app is not None:
+            app.applicationStateChanged.connect(self._on_app_state_changed)
         self._scanning = False  # Track scanning state
         self._scan_connect_task = None # To store the reference to the scan/connect task
+        self.vision_recording = None  # Created lazily by _init_vision_recording
+        self.vision_dock = None
+        self._closing = False  # Set once closeEvent has started the MyoManager shutdown
+        self._close_timer = None
+        self._shutdown_clean = False  # True if everything stopped before SHUTDOWN_TIMEOUT
+        self._disconnecting_start_time = None  # monotonic time "Disconnecting…" was first seen
         self.setWindowTitle("Myo Panel")
 
         # Initialize EMG and IMU modes
@@ -60,12 +145,8 @@ class MainWindow(QMainWindow):
         view_menu = QMenu(self)
         
         # EMG view mode options (moved from Options menu)
-        view_group = QActionGroup(self); view_group.setExclusive(True)
-        act_split  = QAction("Split channel view", self, checkable=True); act_split.setChecked(True)
-        act_comp   = QAction("Composite view", self, checkable=True)
-        for a in (act_split, act_comp):
-            view_group.addAction(a); view_menu.addAction(a)
-        view_group.triggered.connect(lambda a: self._show_split(a is act_split))
+        self._radio(view_menu, ("Split channel view", "Composite view"), (True, False),
+                    on_trig=self._show_split)
         
         view_menu.addSeparator()
         
@@ -100,161 +181,46 @@ class MainWindow(QMainWindow):
 
         #  Vibration sub-menu with *radio* items (just set preference)
         vib_menu = opt_menu.addMenu("Vibration")
-        vib_group = QActionGroup(self); vib_group.setExclusive(True)
-
-        act_v_short  = QAction("Short",  self, checkable=True)
-        act_v_medium = QAction("Medium", self, checkable=True); act_v_medium.setChecked(True)
-        act_v_long   = QAction("Long",   self, checkable=True)
-        for a in (act_v_short, act_v_medium, act_v_long):
-            vib_group.addAction(a); vib_menu.addAction(a)
-
         self._vib_pattern = "medium"             # default
-        def _set_vib(act):
-            self._vib_pattern = act.text().lower()
-        vib_group.triggered.connect(_set_vib)
+        self._radio(vib_menu, ("Short", "Medium", "Long"), ("short", "medium", "long"),
+                    default=1, on_trig=self._set_vib)
 
         #  EMG Mode sub-menu
         emg_menu = opt_menu.addMenu("EMG Mode")
-        emg_group = QActionGroup(self); emg_group.setExclusive(True)
-        
-        act_emg_none = QAction("None (0x00)", self, checkable=True)
-        act_emg_send_emg = QAction("Filtered (0x02)", self, checkable=True)
-        act_emg_send_raw = QAction("Raw (0x03)", self, checkable=True); act_emg_send_raw.setChecked(True)
-        
-        for a in (act_emg_none, act_emg_send_emg, act_emg_send_raw):
-            emg_group.addAction(a); emg_menu.addAction(a)
-            
         self._emg_mode = 3  # default to EMG_MODE_SEND_RAW
-        def _set_emg_mode(act):
-            mode_map = {"None (0x00)": 0, "Filtered (0x02)": 2, "Raw (0x03)": 3}
-            new_mode = mode_map[act.text()]
-            self._emg_mode = new_mode
-            self.myo._emg_mode = new_mode
-            # Apply the change immediately if connected
-            if self.myo.connected:
-                self.status_lbl.setText("Updating EMG mode...")
-                success = self.myo.update_modes(emg_mode=new_mode)
-                if success:
-                    QTimer.singleShot(300, self._update_mode_status)
-                else:
-                    QTimer.singleShot(300, lambda: self.status_lbl.setText("EMG mode update failed"))
-        emg_group.triggered.connect(_set_emg_mode)
+        self._radio(emg_menu, ("None (0x00)", "Filtered (0x02)", "Raw (0x03)"), (0, 2, 3),
+                    default=2, on_trig=self._set_emg_mode)
         
         #  IMU Mode sub-menu
         imu_menu = opt_menu.addMenu("IMU Mode")
-        imu_group = QActionGroup(self); imu_group.setExclusive(True)
-        
-        act_imu_none = QAction("None (0x00)", self, checkable=True)
-        act_imu_send_data = QAction("Data Streams (0x01)", self, checkable=True); act_imu_send_data.setChecked(True)
-        act_imu_send_events = QAction("Motion Events (0x02)", self, checkable=True)
-        act_imu_send_all = QAction("All Data & Events (0x03)", self, checkable=True)
-        act_imu_send_raw = QAction("Raw Data (0x04)", self, checkable=True)
-        
-        for a in (act_imu_none, act_imu_send_data, act_imu_send_events, act_imu_send_all, act_imu_send_raw):
-            imu_group.addAction(a); imu_menu.addAction(a)
-            
         self._imu_mode = 1  # default to IMU_MODE_SEND_DATA
-        def _set_imu_mode(act):
-            mode_map = {
-                "None (0x00)": 0, 
-                "Data Streams (0x01)": 1, 
-                "Motion Events (0x02)": 2, 
-                "All Data & Events (0x03)": 3,
-                "Raw Data (0x04)": 4
-            }
-            new_mode = mode_map[act.text()]
-            self._imu_mode = new_mode
-            self.myo._imu_mode = new_mode
-            # Apply the change immediately if connected
-            if self.myo.connected:
-                self.status_lbl.setText("Updating IMU mode...")
-                success = self.myo.update_modes(imu_mode=new_mode)
-                if success:
-                    QTimer.singleShot(300, self._update_mode_status)
-                else:
-                    QTimer.singleShot(300, lambda: self.status_lbl.setText("IMU mode update failed"))
-        imu_group.triggered.connect(_set_imu_mode)
+        self._radio(imu_menu,
+                    ("None (0x00)", "Data Streams (0x01)", "Motion Events (0x02)",
+                     "All Data & Events (0x03)", "Raw Data (0x04)"),
+                    range(5), default=1, on_trig=self._set_imu_mode)
 
         # NEW: Performance Settings sub-menu
         perf_menu = opt_menu.addMenu("Performance Settings")
         
         # Buffer Size submenu
-        buffer_menu = perf_menu.addMenu("Buffer Size")
-        buffer_group = QActionGroup(self); buffer_group.setExclusive(True)
-        
         buffer_sizes = [200, 500, 1000]
-        buffer_actions = []
-        
-        for size in buffer_sizes:
-            act = QAction(f"{size} samples", self, checkable=True)
-            if size == DEFAULT_SAMPLES:
-                act.setChecked(True)
-            buffer_group.addAction(act)
-            buffer_menu.addAction(act)
-            buffer_actions.append((size, act))
-            
-        def _set_buffer_size(act):
-            for size, action in buffer_actions:
-                if action is act:
-                    self._buffer_size = size
-                    self._ring.resize(size)
-                    self.grid_view.update_buffer_size(size)
-                    self.comp_view.update_buffer_size(size)
-                    break
-                    
-        buffer_group.triggered.connect(_set_buffer_size)
+        self._radio(perf_menu.addMenu("Buffer Size"),
+                    [f"{size} samples" for size in buffer_sizes], buffer_sizes,
+                    default=buffer_sizes.index(DEFAULT_SAMPLES), on_trig=self._set_buffer_size)
         
         # Refresh Interval submenu
-        refresh_menu = perf_menu.addMenu("Refresh Interval")
-        refresh_group = QActionGroup(self); refresh_group.setExclusive(True)
-        
         refresh_intervals = [50, 100, 200, 500]
-        refresh_actions = []
-        
-        for interval in refresh_intervals:
-            act = QAction(f"{interval} ms", self, checkable=True)
-            if interval == FRAME_UPDATE_INTERVAL:
-                act.setChecked(True)
-            refresh_group.addAction(act)
-            refresh_menu.addAction(act)
-            refresh_actions.append((interval, act))
-            
-        self._refresh_timer = None  # Will be initialized later
-            
-        def _set_refresh_interval(act):
-            for interval, action in refresh_actions:
-                if action is act:
-                    self._refresh_interval = interval
-                    if self._refresh_timer:
-                        self._refresh_timer.setInterval(interval)
-                    break
-                    
-        refresh_group.triggered.connect(_set_refresh_interval)
+        self._radio(perf_menu.addMenu("Refresh Interval"),
+                    [f"{interval} ms" for interval in refresh_intervals], refresh_intervals,
+                    default=refresh_intervals.index(FRAME_UPDATE_INTERVAL),
+                    on_trig=self._set_refresh_interval)
         
         # Downsample Ratio submenu
-        downsample_menu = perf_menu.addMenu("Downsample Ratio")
-        downsample_group = QActionGroup(self); downsample_group.setExclusive(True)
-        
         downsample_ratios = [1, 2, 4, 8, 16]
-        downsample_actions = []
-        
-        for ratio in downsample_ratios:
-            act = QAction(f"1:{ratio}" if ratio > 1 else "None", self, checkable=True)
-            if ratio == 4:  # Default is 1:4
-                act.setChecked(True)
-            downsample_group.addAction(act)
-            downsample_menu.addAction(act)
-            downsample_actions.append((ratio, act))
-            
-        def _set_downsample_ratio(act):
-            for ratio, action in downsample_actions:
-                if action is act:
-                    self._downsample_ratio = ratio
-                    self.grid_view.set_downsample(ratio)
-                    self.comp_view.set_downsample(ratio)
-                    break
-                    
-        downsample_group.triggered.connect(_set_downsample_ratio)
+        self._radio(perf_menu.addMenu("Downsample Ratio"),
+                    [f"1:{ratio}" if ratio > 1 else "None" for ratio in downsample_ratios],
+                    downsample_ratios, default=2,  # Default is 1:4
+                    on_trig=self._set_downsample_ratio)
 
         #  Camera Settings sub-menu
         cam_menu = opt_menu.addMenu("Camera Settings")
@@ -268,47 +234,25 @@ class MainWindow(QMainWindow):
         # Default camera action is always available
         act_cam_default = QAction("Default Camera", self, checkable=True)
         act_cam_default.setChecked(True)
+        act_cam_default.setData(0)
         cam_group.addAction(act_cam_default)
         cam_menu.addAction(act_cam_default)
         self.cam_actions.append({"action": act_cam_default, "id": 0})
-        
-        # Set camera function
-        def _set_camera(act):
-            # Find the camera ID for this action
-            for cam in self.cam_actions:
-                if cam["action"] is act:
-                    # Set camera in vision recording widget if it exists
-                    if hasattr(self, "vision_recording") and self.vision_recording:
-                        self.vision_recording.camera_manager.set_camera(cam["id"])
-                    break
-                    
-        cam_group.triggered.connect(_set_camera)
+        cam_group.triggered.connect(self._set_camera)
         
         # Resolution sub-menu
-        res_menu = cam_menu.addMenu("Resolution")
-        res_group = QActionGroup(self); res_group.setExclusive(True)
-        
-        act_res_low = QAction("Low (320x240)", self, checkable=True)
-        act_res_med = QAction("Medium (640x480)", self, checkable=True); act_res_med.setChecked(True)
-        act_res_high = QAction("High (1280x720)", self, checkable=True)
-        
-        for a in (act_res_low, act_res_med, act_res_high):
-            res_group.addAction(a); res_menu.addAction(a)
-        
-        # Set resolution function
-        def _set_resolution(act):
-            if hasattr(self, "vision_recording") and self.vision_recording:
-                if act is act_res_low:
-                    self.vision_recording.camera_manager.set_resolution(320, 240)
-                elif act is act_res_med:
-                    self.vision_recording.camera_manager.set_resolution(640, 480)
-                elif act is act_res_high:
-                    self.vision_recording.camera_manager.set_resolution(1280, 720)
-        
-        res_group.triggered.connect(_set_resolution)
-        
-        # Populate available cameras
-        self._populate_camera_menu(cam_menu, cam_group)
+        self._radio(cam_menu.addMenu("Resolution"),
+                    ("Low (320x240)", "Medium (640x480)", "High (1280x720)"),
+                    ((320, 240), (640, 480), (1280, 720)), default=1, on_trig=self._set_resolution)
+        
+        # Populate available cameras. Enumeration runs on a pool thread and can
+        # be cancelled through _cam_probe_cancel (set when the window closes).
+        self._cam_menu, self._cam_group = cam_menu, cam_group
+        self._cam_probe = None
+        self._cam_probe_cancel = threading.Event()
+        self._cam_menu_last_refresh = 0.0
+        # Enumerate only when the menu is opened, never at startup
+        cam_menu.aboutToShow.connect(self._populate_camera_menu_if_stale)
 
         opt_btn = QToolButton()
         opt_btn.setText("Options")
@@ -334,12 +278,18 @@ class MainWindow(QMainWindow):
         self.emg_dock.setAllowedAreas(Qt.AllDockWidgetAreas)
         # Only allow moving, no floating/popup
         self.emg_dock.setFeatures(QDockWidget.DockWidgetMovable)
+        self.emg_dock.visibilityChanged.connect(self._on_emg_dock_visibility)
         
         # Recording panel dock widget - remove title as it's already in the GroupBox
         self.record_panel = RecordingPanel(self.myo)
+        self.record_panel.about_to_stop.connect(self._flush_imu_recording)
         # Disable recording buttons initially since no device is connected
         self.record_panel.timer_btn.setEnabled(False)
         self.record_panel.free_btn.setEnabled(False)
+        # Controls that follow the connection state, see _set_controls_enabled
+        self._enable_when_connected = (self.disc_act, self.off_act, self.vib_act, self.pause_act,
+                                       self.record_panel.timer_btn, self.record_panel.free_btn)
+        self._enable_when_disconnected = (self.scan_act,)
         
         # Connect the Enable Vision checkbox
         self.record_panel.enable_vision_chk.stateChanged.connect(self._toggle_vision_feature)
@@ -358,6 +308,7 @@ class MainWindow(QMainWindow):
         self.imu_dock.setAllowedAreas(Qt.AllDockWidgetAreas)
         # Only allow moving, no floating/popup
         self.imu_dock.setFeatures(QDockWidget.DockWidgetMovable)
+        self.imu_dock.visibilityChanged.connect(lambda v: setattr(self, "_imu_visible", v))
         
         # Vision Based Recording dock widget - lazy loaded
         # Will be created on demand when needed
@@ -381,14 +332,24 @@ class MainWindow(QMainWindow):
         sb = QStatusBar(); self.setStatusBar(sb)
         self.status_lbl = QLabel("Disconnected"); sb.addWidget(self.status_lbl)
         self.batt_lbl   = QLabel("Battery: -- %"); sb.addPermanentWidget(self.batt_lbl)
+        self._last_batt = None  # Level batt_lbl currently shows
+        self.battery_read.connect(self._update_batt_lbl, Qt.QueuedConnection)
+
+        # ── EMG plot refresh ──────────────────────────────────────────
+        # Driven by the data: on_emg_frames signals once a refresh interval's worth
+        # of frames is pending, so nothing wakes up while the stream is idle
+        self._emg_signalled = False
+        self._set_refresh_interval(self._refresh_interval)
+        self.emg_ready.connect(self._refresh_plots, Qt.QueuedConnection)
 
         # ── timers ────────────────────────────────────────────────────
-        self._refresh_timer = QTimer(self, interval=self._refresh_interval, timeout=self._refresh_plots)
+        # One master timer drives the IMU cube and recording hand-off, plus
+        # battery polling and the connection status check (both every
+        # BATTERY_CHECK_INTERVAL)
+        self._tick = 0
+        self._battery_every = BATTERY_CHECK_INTERVAL // TICK_INTERVAL
+        self._refresh_timer = QTimer(self, interval=TICK_INTERVAL, timeout=self._on_tick)
         self._refresh_timer.start()
-        QTimer(self, interval=BATTERY_CHECK_INTERVAL, timeout=self._query_battery).start()
-        
-        # Add a connection status checker timer - runs every 500ms to ensure UI is accurate
-        QTimer(self, interval=500, timeout=self._check_connection_status).start()
 
         # ── connect actions ───────────────────────────────────────────
         self.scan_act.triggered.connect(self._scan_connect)
@@ -399,7 +360,71 @@ class MainWindow(QMainWindow):
 
         # ── connect IMU handler ───────────────────────────────────────
         self.myo._imu_handler = self._on_imu
+
+        threading.Thread(target=_warm_vision_import, daemon=True).start()
     
+    def _radio(self, menu, labels, data_list, default=0, on_trig=None):
+        """Add an exclusive group of checkable actions to *menu*.
+
+        Each action carries its entry of *data_list* as QAction.data(), and
+        *on_trig* is called with that value when the user picks an action.
+        """
+        grp = QActionGroup(self); grp.setExclusive(True)
+        for i, (text, data) in enumerate(zip(labels, data_list)):
+            a = QAction(text, self, checkable=True)
+            a.setData(data); a.setChecked(i == default)
+            grp.addAction(a); menu.addAction(a)
+        if on_trig:
+            grp.triggered.connect(lambda a: on_trig(a.data()))
+
+    # ------------- option menu handlers -----------------------------
+    def _set_vib(self, pattern):
+        self._vib_pattern = pattern
+
+    def _set_emg_mode(self, new_mode):
+        self._emg_mode = new_mode
+        self.myo._emg_mode = new_mode
+        # Apply the change immediately if connected
+        if self.myo.connected:
+            self.status_lbl.setText("Updating EMG mode...")
+            success = self.myo.update_modes(emg_mode=new_mode)
+            if success:
+                QTimer.singleShot(300, self._update_mode_status)
+            else:
+                QTimer.singleShot(300, partial(self._set_status, "EMG mode update failed"))
+
+    def _set_imu_mode(self, new_mode):
+        self._imu_mode = new_mode
+        self.myo._imu_mode = new_mode
+        # Apply the change immediately if connected
+        if self.myo.connected:
+            self.status_lbl.setText("Updating IMU mode...")
+            success = self.myo.update_modes(imu_mode=new_mode)
+            if success:
+                QTimer.singleShot(300, self._update_mode_status)
+            else:
+                QTimer.singleShot(300, partial(self._set_status, "IMU mode update failed"))
+
+    def _set_buffer_size(self, size):
+        self._buffer_size = size
+        self._ring.resize(size)
+        self.grid_view.update_buffer_size(size)
+        self.comp_view.update_buffer_size(size)
+
+    def _set_downsample_ratio(self, ratio):
+        self._downsample_ratio = ratio
+        self.grid_view.set_downsample(ratio)
+        self.comp_view.set_downsample(ratio)
+
+    def _set_camera(self, act):
+        # Set camera in vision recording widget if it exists
+        if self.vision_recording is not None:
+            self.vision_recording.camera_manager.set_camera(act.data())
+
+    def _set_resolution(self, size):
+        if self.vision_recording is not None:
+            self.vision_recording.camera_manager.set_resolution(*size)
+
     # ------------- dock widget visibility toggle ------------------
     def _toggle_dock_visibility(self, dock_name, visible):
         """Toggle the visibility of a dock widget."""
@@ -416,63 +441,140 @@ class MainWindow(QMainWindow):
     def _toggle_vision_view(self, checked):
         """Toggle the visibility of the vision panel from the View menu."""
         # Initialize the vision panel if needed and checked
-        if checked and "vision" not in self.dock_widgets:
+        if checked and self.vision_dock is None:
             if not self._init_vision_recording():
                 # Failed to initialize, uncheck the menu item
                 self.show_vision_act.setChecked(False)
                 return
         
         # Toggle visibility if the dock exists
-        if "vision" in self.dock_widgets:
+        if self.vision_dock is not None:
             self._toggle_dock_visibility("vision", checked)
             
             # If showing the panel, also check the enable vision checkbox
             if checked:
                 self.record_panel.enable_vision_chk.setChecked(True)
 
+    # ------------- master timer -------------------------------------
+    @Slot()
+    def _on_tick(self):
+        self._tick += 1
+        self._flush_imu_recording()
+        quat = self._pending_quat
+        if quat is not None:
+            self._pending_quat = None
+            if self._imu_visible:
+                self.imu.update_quaternion(quat)
+        if self._tick % self._battery_every == 0:
+            self._query_battery()
+            # Connection changes arrive through _on_connection_changed; this
+            # only catches transitions the manager reports silently
+            self._check_connection_status()
+
+    def _set_refresh_interval(self, interval):
+        """Redraw the EMG plots about every *interval* ms while data arrives."""
+        self._refresh_interval = interval
+        self._emg_chunk = max(2, interval * EMG_FRAME_RATE // 1000)
+
     # ───────────────────────────────────────────────────────────────────
+    @Slot()
     def _refresh_plots(self):
-        if self._paused or not self._frame_q:
+        # Re-arm before the snapshot so frames published after it signal again
+        self._emg_signalled = False
+        widx = self._widx
+        if self._paused or widx == self._ridx:
+            return
+        if not self._app_visible:
+            self._ridx = widx  # Nothing on screen: drop the frames, skip the redraw
             return
-        take = min(len(self._frame_q), 20)
-        frames = [self._frame_q.pop() for _ in range(take)][::-1]   # preserve order
-        self._ring.insert(np.array(frames).T)
-        (self.grid_view if self.grid_view.isVisible() else self.comp_view).refresh()
+        # If the GUI fell behind, plot at most half the ring: on_emg_frames keeps
+        # writing ahead of widx and must not overwrite rows being read
+        take = min(widx - self._ridx, EMG_QUEUE_LEN // 2)
+        start = (widx - take) & EMG_QUEUE_MASK
+        view = self.grid_view if self._split_view else self.comp_view
+        view.push_and_refresh(self._frame_buf[start:start + take].T)
+        self._ridx = widx
+
+    def _on_app_state_changed(self, state):
+        self._app_state_hidden = state in (Qt.ApplicationHidden, Qt.ApplicationSuspended)
+        self._app_visible = not (self._app_state_hidden or self.isMinimized())
+
+    def changeEvent(self, event):
+        if event.type() == QEvent.WindowStateChange:
+            self._app_visible = not (self._app_state_hidden or self.isMinimized())
+        super().changeEvent(event)
+
+    def _on_emg_dock_visibility(self, visible):
+        # Recording is fed straight from the manager (see main.py), so the
+        # frame ring is only needed while the plots can be seen
+        self._emg_sink_needed = visible
 
     # ------------- BLE stream callback -------------------------------
-    def on_emg(self, _bank, two_frames):
-        if not self._paused:
-            # Append both frames for all EMG modes (1, 2, 3)
-            # EMG_MODE_NONE (0) is handled in main.py before this is called
-            self._frame_q.append(two_frames[0])
-            self._frame_q.append(two_frames[1])
+    def on_emg_frames(self, _bank, frames):
+        """Queue both EMG frames of a notification, a (2, 8) int8 array, for plotting.
+
+        Called on the BLE thread for every EMG mode except EMG_MODE_NONE.
+        """
+        if not self._paused and self._emg_sink_needed:
+            # _widx is always even and EMG_QUEUE_LEN is even, so both rows
+            # land in one contiguous slice of each mirror half
+            buf, w = self._frame_buf, self._widx
+            i = w & EMG_QUEUE_MASK
+            buf[i:i + 2] = buf[i + EMG_QUEUE_LEN:i + EMG_QUEUE_LEN + 2] = frames
+            self._publish_emg(w + 2)
+
+    def _publish_emg(self, widx):
+        # Publish the new frames to the GUI thread at once, then wake it if a
+        # refresh's worth is pending and no wake-up is in flight yet
+        self._widx = widx
+        if not self._emg_signalled and widx - self._ridx >= self._emg_chunk:
+            self._emg_signalled = True
+            self.emg_ready.emit()
 
     # ------------- IMU callback ------------------------------------
     def _on_imu(self, quat, acc, gyro, timestamp=None, raw_hex=None):
         """Handle IMU data for both visualization and recording."""
         # Debug output - print IMU data periodically
-        if getattr(self, "_imu_debug_counter", 0) % 100 == 0:  # Every 100 readings
-            print(f"IMU data: quat={quat}, gyro={gyro}")
-        
-        # Increment debug counter
-        self._imu_debug_counter = getattr(self, "_imu_debug_counter", 0) + 1
+        c = self._imu_debug_counter
+        self._imu_debug_counter = c + 1
+        if c % 100 == 0:  # Every 100 readings
+            log.debug("IMU data: quat=%s, gyro=%s", quat, gyro)
         
         # Update 3D visualization using either quaternion or gyro data
         # But only update if the IMU widget is visible (save CPU when not needed)
-        if self.imu_dock.isVisible():
+        if self._imu_visible:
             if quat is not None:
-                self.imu.update_quaternion(quat)
+                # Absolute orientation: only the newest one per tick matters
+                self._pending_quat = quat
             elif gyro is not None:
+                # Gyro deltas are integrated, so each one must be applied
                 self.imu.update_gyro(gyro)
         
-        # Record IMU data
-        self.record_panel.push_imu(quat, acc, gyro, timestamp, raw_hex)
+        # Record IMU data; handed over in one batch per tick
+        if self.record_panel.is_recording():
+            self._imu_pend.append((timestamp, quat, acc, gyro, raw_hex))
+
+    def _flush_imu_recording(self):
+        pend = self._imu_pend
+        n = len(pend)  # Only take what is there now; on_imu may keep appending
+        if n:
+            self.record_panel.push_imu_batch(*zip(*[pend.popleft() for _ in range(n)]))
 
     # ------------- battery polling -----------------------------------
+    @Slot()
     def _query_battery(self):
-        self.myo.refresh_battery_async()
-        QTimer.singleShot(100, lambda: self.batt_lbl.setText(
-            f"Battery: {self.myo.battery:>3d} %" if self.myo.battery is not None else "Battery: -- %"))
+        if not self.myo.connected:
+            self._update_batt_lbl(None)  # No read will come back to clear it
+            return
+        # The label updates as soon as the read completes, not on a guess
+        self.myo.refresh_battery_async(self.battery_read.emit)
+
+    @Slot(object)
+    def _update_batt_lbl(self, level):
+        if level == self._last_batt:
+            return  # Unchanged: skip the relayout setText would trigger
+        self._last_batt = level
+        self.batt_lbl.setText(f"Battery: {level:>3d} %" if level is not None else "Battery: -- %")
 
     # ------------- scan + connect ------------------------------------
     def _scan_connect(self):
@@ -485,38 +587,21 @@ class MainWindow(QMainWindow):
         self.scan_act.setEnabled(False)
         self.status_lbl.setText("Scanning…")
         
-        # Add a timeout timer to abort excessively long operations
-        connection_timeout = QTimer(self)
-        connection_timeout.setSingleShot(True)
-        connection_timeout.setInterval(15000)  # 15 seconds timeout
-        
-        # Force abort function for connection that takes too long
-        def _connection_timeout_handler():
-            if self._scanning and self._scan_connect_task and not self._scan_connect_task.done():
-                # Cancel the task if it's still running after timeout
-                print("[MainWindow] Connection timeout - forcing abort")
-                self._scan_connect_task.cancel()
-                # Skip status update - let the status checker handle it consistently
-                # This avoids showing misleading status messages
-                pass
-        
-        connection_timeout.timeout.connect(_connection_timeout_handler)
-        
         async def _do():
             try:
-                # Start the timeout timer
-                connection_timeout.start()
-                
-                loop = asyncio.get_running_loop()
-                devs = await loop.run_in_executor(None, self.myo.scan)
-                
-                # Check for cancellation after potentially long operation
-                await asyncio.sleep(0) # Allows task to be cancelled if requested
+                # Bound each BLE operation separately so time spent in the
+                # device dialog never counts against them; the timeouts run
+                # on the BLE loop next to the operations themselves
+                try:
+                    devs = await self.myo.scan_async(timeout=SCAN_TIMEOUT)
+                except asyncio.TimeoutError:
+                    log.warning("Scan timed out after %.0f s", SCAN_TIMEOUT)
+                    self.status_lbl.setText("Scan timed out")
+                    return
                 if not devs:
                     self.status_lbl.setText("No MYO found")
                     return
 
-                from PySide6.QtWidgets import QInputDialog, QDialog
                 items = [f"{d['name']} ({d['address']})" for d in devs]
                 dlg = QInputDialog(self)
                 dlg.setWindowTitle("Select MYO")
@@ -539,10 +624,11 @@ class MainWindow(QMainWindow):
                 await asyncio.sleep(0)
                 try:
                     # Use the configured EMG and IMU modes
-                    await loop.run_in_executor(None, lambda: self.myo.connect(addr, emg_mode=self._emg_mode, imu_mode=self._imu_mode))
+                    await self.myo.connect_async(addr, emg_mode=self._emg_mode, imu_mode=self._imu_mode,
+                                                 timeout=CONNECT_TIMEOUT)
                     
                     # Explicit status update when connection succeeds
-                    print(f"[MainWindow] Connected to {name}")
+                    log.info("Connected to %s", name)
                     
                     # Update UI status explicitly here even though the callback should also do it
                     # This provides redundancy in case the callback has issues
@@ -551,30 +637,30 @@ class MainWindow(QMainWindow):
                     # Schedule another status update for detailed info
                     QTimer.singleShot(200, self._update_mode_status)
                     
+                except asyncio.TimeoutError:
+                    # connect_async disconnects again when it times out
+                    log.warning("Connection to %s timed out after %.0f s", name, CONNECT_TIMEOUT)
+                    self.status_lbl.setText("Connection timed out")
                 except Exception as exc:
                     # Handle connection errors
-                    print(f"[MainWindow] Connect error: {exc}")
+                    log.warning("Connect error: %s", exc)
                     self.status_lbl.setText(f"Connection failed: {str(exc)}")
                     
                     # Show error dialog
                     try:
-                        from PySide6.QtWidgets import QMessageBox
                         QMessageBox.critical(self, "Connect failed", str(exc))
                     except RuntimeError:
                         # Handle case where Qt objects are deleted
                         pass
             except asyncio.CancelledError:
-                print("[MainWindow._do] Scan/connect task was cancelled.")
+                log.info("Scan/connect task was cancelled")
                 # Skip status update entirely - let the status checker handle it
                 # This avoids any misleading messages about waiting for the device
                 pass
             except Exception as e:
-                print(f"[MainWindow._do] Unexpected error: {e}")
+                log.exception("Unexpected error during scan/connect")
                 self.status_lbl.setText(f"Error: {str(e)}")
             finally:
-                # Stop the timeout timer
-                connection_timeout.stop()
-                
                 # Reset state flags
                 self._scanning = False
                 self._scan_connect_task = None
@@ -591,6 +677,7 @@ class MainWindow(QMainWindow):
         self._scan_connect_task = asyncio.create_task(_do())
 
     # ------------- manual disconnect ---------------------------------
+    @Slot()
     def _disconnect(self):
         # Only update status label - button states will be handled by connection callback
         self.status_lbl.setText("Disconnecting…")
@@ -609,22 +696,17 @@ class MainWindow(QMainWindow):
         # Add a safety timer to ensure UI gets updated
         def _ensure_disconnected():
             if self.status_lbl.text() == "Disconnecting…" and not self.myo.connected:
-                print("[MainWindow] Safety timer: Forcing 'Disconnected' status")
+                log.info("Safety timer: forcing 'Disconnected' status")
                 self.status_lbl.setText("Disconnected")
                 
                 # Also ensure buttons are in correct state
-                self.disc_act.setEnabled(False)
-                self.off_act.setEnabled(False)
-                self.vib_act.setEnabled(False)
-                self.pause_act.setEnabled(False)
-                self.scan_act.setEnabled(True)
-                self.record_panel.timer_btn.setEnabled(False)
-                self.record_panel.free_btn.setEnabled(False)
+                self._set_controls_enabled(False)
                 
         # Force update after 1.5 seconds if needed
         QTimer.singleShot(1500, _ensure_disconnected)
 
     # ------------- turn off (deep-sleep) ------------------------------
+    @Slot()
     def _turn_off(self):
         # Only update status label - button states will be handled by connection callback
         self.status_lbl.setText("Turning off…")
@@ -641,18 +723,23 @@ class MainWindow(QMainWindow):
         self.myo.deep_sleep_async()
         
         # Override final status message to be more specific about power state
-        QTimer.singleShot(600, lambda: self.status_lbl.setText("Device powered off (disconnected)"))
+        QTimer.singleShot(600, partial(self._set_status, "Device powered off (disconnected)"))
 
     # ------------- pause / resume ------------------------------------
+    @Slot()
     def _toggle_pause(self):
         self._paused = not self._paused
         self.pause_act.setText("Resume Stream" if self._paused else "Pause Stream")
-        if self._paused: self._frame_q.clear()
+        if self._paused: self._ridx = self._widx
 
     # ------------- view switching ------------------------------------
     def _show_split(self, split: bool):
+        self._split_view = split
         self.grid_view.setVisible(split); self.comp_view.setVisible(not split)
         
+    def _set_status(self, text):
+        self.status_lbl.setText(text)
+
     # ------------- mode status display -----------------------------
     def _update_mode_status(self):
         """Update the status bar with current EMG and IMU modes."""
@@ -681,68 +768,103 @@ class MainWindow(QMainWindow):
         
         # IMPORTANT: Always ensure button states match connection state
         # This guarantees UI consistency whenever detailed status is shown
-        self.disc_act.setEnabled(True)
-        self.off_act.setEnabled(True)
-        self.vib_act.setEnabled(True)
-        self.pause_act.setEnabled(True)
-        self.scan_act.setEnabled(False)  # Can't scan when connected
-        self.record_panel.timer_btn.setEnabled(True)
-        self.record_panel.free_btn.setEnabled(True)
-        
-        # Force UI update to ensure changes are visible
-        from PySide6.QtWidgets import QApplication
-        QApplication.processEvents()
+        self._set_controls_enabled(True)
 
     # ------------- populate camera menu ----------------------------
-    def _populate_camera_menu(self, menu, group):
-        """Populate camera menu with available cameras."""
-        if not hasattr(self, "vision_recording") or not self.vision_recording:
+    def _populate_camera_menu_if_stale(self):
+        """Refresh the camera menu on open, at most once per CAMERA_MENU_TTL."""
+        if self.vision_recording is None or self._cam_probe is not None:
             return
-            
-        # Get available cameras
-        cameras = self.vision_recording.camera_manager.get_available_cameras()
+        if self._cam_probe_cancel.is_set():
+            return
+        now = time.monotonic()
+        if now - self._cam_menu_last_refresh < CAMERA_MENU_TTL:
+            return
+        self._cam_menu_last_refresh = now
+        
+        # Probe off the GUI thread; the menu is rebuilt when results arrive
+        self._cam_probe = CameraProbeWorker(self.vision_recording.camera_manager,
+                                            self._cam_probe_cancel)
+        self._cam_probe.signals.found.connect(self._on_cameras_found)
+        QThreadPool.globalInstance().start(self._cam_probe)
+
+    def _on_cameras_found(self, cameras):
+        """Rebuild the camera menu from a finished CameraProbeWorker."""
+        self._cam_probe = None
+        self._populate_camera_menu(self._cam_menu, self._cam_group, cameras)
+
+    def _populate_camera_menu(self, menu, group, cameras):
+        """Populate camera menu with available cameras."""
+        # Drop cameras found by a previous scan, keeping "Default Camera"
+        checked = group.checkedAction()
+        selected_id = next((cam["id"] for cam in self.cam_actions if cam["action"] is checked), 0)
+        for cam in self.cam_actions[1:]:
+            group.removeAction(cam["action"])
+            menu.removeAction(cam["action"])
+            cam["action"].deleteLater()  # Parented to the window, so free it explicitly
+        del self.cam_actions[1:]
         
         # Skip first camera (Default) as it's already added
         for camera in cameras[1:]:
             action = QAction(camera["name"], self, checkable=True)
+            action.setData(camera["id"])
             group.addAction(action)
             menu.addAction(action)
             self.cam_actions.append({"action": action, "id": camera["id"]})
+        
+        # Keep the previous selection if that camera is still present
+        for cam in self.cam_actions:
+            if cam["id"] == selected_id:
+                cam["action"].setChecked(True)
+                break
+        else:
+            # The selected camera is gone: switch the capture to the default
+            # too (setChecked does not emit triggered)
+            default = self.cam_actions[0]["action"]
+            default.setChecked(True)
+            self._set_camera(default)
     
     # ------------- initialize Vision Recording widget -------------
     def _init_vision_recording(self):
         """Initialize the CV View widget if not already done."""
         # Import the necessary modules only when needed
         try:
-            print("Initializing CV View widget...")
+            log.debug("Initializing CV View widget")
             from .vision_recording import VisionRecordingWidget
             
             # Create the Vision Recording widget
             self.vision_recording = VisionRecordingWidget()
             
             self.vision_dock = QDockWidget("CV View", self)
-            self.vision_dock.setWidget(self.vision_recording)
-            self.vision_dock.setAllowedAreas(Qt.AllDockWidgetAreas)
-            # Only allow moving, no floating/popup
-            self.vision_dock.setFeatures(QDockWidget.DockWidgetMovable)
-            # Hide by default
-            self.vision_dock.setVisible(False)
-            
-            # Add dock widget to the main window
-            self.addDockWidget(Qt.RightDockWidgetArea, self.vision_dock)
+            # Configure in one batch so the setters below don't each emit
+            # dock signals and trigger a repaint of their own
+            self.vision_dock.setUpdatesEnabled(False)
+            self.vision_dock.blockSignals(True)
+            try:
+                self.vision_dock.setWidget(self.vision_recording)
+                self.vision_dock.setAllowedAreas(Qt.AllDockWidgetAreas)
+                # Only allow moving, no floating/popup
+                self.vision_dock.setFeatures(QDockWidget.DockWidgetMovable)
+                # Hide by default
+                self.vision_dock.setVisible(False)
+                
+                # Add dock widget to the main window
+                self.addDockWidget(Qt.RightDockWidgetArea, self.vision_dock)
+            finally:
+                self.vision_dock.blockSignals(False)
+                self.vision_dock.setUpdatesEnabled(True)
             
-            # Add to dictionary to track dock widgets
+            # Keep the name lookup used by _toggle_dock_visibility in sync
             self.dock_widgets["vision"] = self.vision_dock
             
-            print("CV View widget initialized successfully.")
+            log.debug("CV View widget initialized")
             return True
         except ImportError as e:
-            print(f"Failed to initialize CV View - ImportError: {e}")
+            log.warning("Failed to initialize CV View - ImportError: %s", e)
             return False
-        except Exception as e:
-            print(f"Failed to initialize CV View - Unexpected error: {e}")
-            import traceback
-            traceback.print_exc()
+        except Exception:
+            log.exception("Failed to initialize CV View - Unexpected error")
+            self.vision_recording = self.vision_dock = None
             return False
 
     # ------------- toggle vision feature ---------------------------
@@ -754,7 +876,7 @@ class MainWindow(QMainWindow):
         """
         if state == Qt.Checked:
             # Initialize the Vision Recording widget if needed
-            if "vision" not in self.dock_widgets:
+            if self.vision_dock is None:
                 if not self._init_vision_recording():
                     # Failed to initialize
                     return
@@ -762,72 +884,94 @@ class MainWindow(QMainWindow):
             # Only show the vision dock when checked, don't hide when unchecked
             self.vision_dock.setVisible(True)
             self.show_vision_act.setChecked(True)
-            
-            # Populate camera menu
-            opt_btn = self.findChild(QToolButton, "opt_btn")
-            if opt_btn and opt_btn.menu():
-                cam_menu = opt_btn.menu().findChild(QMenu, "cam_menu")
-                if cam_menu:
-                    cam_group = cam_menu.findChild(QActionGroup)
-                    if cam_group:
-                        self._populate_camera_menu(cam_menu, cam_group)
 
     def closeEvent(self, event):
-        """Handle application close."""
-        print("MainWindow: closeEvent called.")
+        """Handle application close.
 
-        # Flag to indicate shutdown is in progress
-        self._shutting_down = True
+        The first call starts a non-blocking MyoManager shutdown and ignores the
+        event; _poll_shutdown re-issues close() once it has finished or timed out.
+        """
+        if not self._closing:
+            log.debug("closeEvent called")
+            self._closing = True
 
-        # Cancel the scan/connect task if it's running
-        if self._scan_connect_task and not self._scan_connect_task.done():
-            print("MainWindow: Cancelling active scan/connect task.")
-            self._scan_connect_task.cancel()
-            # We don't await it here as closeEvent is synchronous and we need it to proceed.
-            # The task should handle its cancellation and cleanup in its finally block.
-
-        # Initiate MyoManager shutdown. This is a blocking call with a timeout.
-        print("MainWindow: Initiating MyoManager shutdown...")
-        if self.myo:  # Ensure myo object exists
-            self.myo.shutdown(timeout=2.0) # Reduced timeout for faster exit
-            print("MainWindow: MyoManager shutdown process completed or timed out.")
-        else:
-            print("MainWindow: MyoManager instance not found.")
+            # Cancel the scan/connect task if it's running
+            if self._scan_connect_task and not self._scan_connect_task.done():
+                log.debug("Cancelling active scan/connect task")
+                self._scan_connect_task.cancel()
+                # The task handles its cancellation and cleanup in its finally block
+                # while the event loop keeps running; _poll_shutdown waits for it.
+
+            # Abort any camera enumeration still running on the thread pool
+            self._cam_probe_cancel.set()
+
+            # Initiate MyoManager shutdown without blocking the event loop
+            log.debug("Initiating MyoManager shutdown")
+            if self.myo:  # Ensure myo object exists
+                self.myo.request_stop()
+            else:
+                log.debug("MyoManager instance not found")
+
+            self._close_deadline = time.monotonic() + SHUTDOWN_TIMEOUT
+            self._close_timer = QTimer(self, interval=SHUTDOWN_POLL_INTERVAL,
+                                       timeout=self._poll_shutdown)
+            self._close_timer.start()
+            event.ignore()
+            return
+
+        if self._close_timer.isActive():
+            # Still waiting for MyoManager to finish shutting down
+            event.ignore()
+            return
 
         # Clean up vision recording if it exists
-        if hasattr(self, 'vision_recording') and self.vision_recording:
-            if hasattr(self.vision_recording, "camera_manager") and self.vision_recording.camera_manager.running:
-                print("MainWindow: Forcing camera_manager stop as a fallback.")
-                self.vision_recording.camera_manager.stop()
+        if self.vision_recording is not None and self.vision_recording.camera_manager.stop_if_running():
+            log.debug("Forced camera_manager stop as a fallback")
         
         # Call parent's closeEvent
         super().closeEvent(event)
-        print("MainWindow: closeEvent completed. Application should now exit if all non-daemon threads are done.")
-        
-        # Import inside the method to avoid circular imports
-        from PySide6.QtWidgets import QApplication
-        from ..ble.myo_manager import stop_bg_loop
+        log.debug("closeEvent completed; exiting once non-daemon threads are done")
         
         # Direct cleanup of the background loop
         stop_bg_loop()
-        
-        # Force application to quit after a short delay if it hasn't exited naturally
-        from PySide6.QtCore import QTimer
-        def force_quit():
-            print("MainWindow: Forcing application exit")
-            import os, signal, sys
-            # First try SIGTERM
+
+        if self._shutdown_clean:
+            # Closing the last window quits the app; nothing is left to force
+            return
+
+        # Something did not stop in time: force the application to quit
+        def signal_self(sig):
             try:
-                os.kill(os.getpid(), signal.SIGTERM)
-                # Short delay to allow SIGTERM to work
-                QTimer.singleShot(500, lambda: sys.exit(1))
+                os.kill(os.getpid(), sig)
             except Exception as e:
-                print(f"MainWindow: Error during force quit: {e}")
-                sys.exit(1)  # Exit with error
-            
-        # Give the application much less time (1 second) to exit naturally, then force quit
+                log.error("Error during force quit: %s", e)
+
+        def force_quit():
+            log.warning("Forcing application exit")
+            # First let Qt unwind its event loop and deferred deletes
+            QApplication.instance().quit()
+            # If the loop is still running, raise SIGINT: main.py's handler
+            # quits again and arms a hard os._exit two seconds later, which
+            # skips atexit (the background loop is already stopped above).
+            # SIGTERM goes to the same handler, so there is nothing to add
+            QTimer.singleShot(500, partial(signal_self, signal.SIGINT))
+
+        # Give the application a second to exit naturally, then force quit
         QTimer.singleShot(1000, force_quit)
 
+    def _poll_shutdown(self):
+        """Finish closing once MyoManager and the scan/connect task have stopped,
+        or the timeout expired."""
+        task = self._scan_connect_task
+        stopped = ((self.myo.join(0) if self.myo else True)
+                   and (task is None or task.done()))
+        if not stopped and time.monotonic() < self._close_deadline:
+            return
+        self._close_timer.stop()
+        self._shutdown_clean = stopped
+        log.debug("Shutdown %s", "completed" if stopped else "timed out")
+        self.close()
+
     # ------------- connection state change callback ------------------
     def _on_connection_changed(self, connected, reason):
         """Handle connection state changes from MyoManager.
@@ -841,70 +985,48 @@ class MainWindow(QMainWindow):
             reason: str - reason for the state change
         """
         try:
-            print(f"[MainWindow] Connection state changed: connected={connected}, reason={reason}")
-            
-            # Use QTimer.singleShot to safely update UI from a non-Qt thread
-            # This avoids Qt metaobject signature issues
-            from PySide6.QtCore import QTimer
-            
-            # First do an immediate state update for critical UI elements
-            # This reduces the chance of experiencing inconsistent UI state
-            QTimer.singleShot(0, lambda: self._set_ui_connected_state(connected))
-            
-            # Then do the full update with text changes
-            QTimer.singleShot(50, lambda: self._update_ui_connection_state(connected, reason))
-            
-            # Also schedule a fallback update to handle any race conditions
-            # This ensures we'll update the UI status after a short delay as a backup
-            if connected:
-                # If connected, schedule another status update as a backup
-                QTimer.singleShot(1000, lambda: 
-                    self._set_ui_connected_state(True) 
-                    if self.myo.connected 
-                    else None
-                )
-        except Exception as e:
-            print(f"[MainWindow] Error in connection callback: {e}")
+            log.debug("Connection state changed: connected=%s, reason=%s", connected, reason)
+            # Usually called on the BLE thread, which has no Qt event loop:
+            # queue the update onto the GUI thread
+            QMetaObject.invokeMethod(self, "_apply_connection_state", Qt.QueuedConnection,
+                                     Q_ARG(bool, connected), Q_ARG(str, reason))
+        except Exception:
+            log.exception("Error in connection callback")
+
+    @Slot(bool, str)
+    def _apply_connection_state(self, connected, reason):
+        """GUI-thread half of _on_connection_changed."""
+        try:
+            # Sets the button states first, then the status text; queued
+            # delivery already orders this after the change it reports
+            self._update_ui_connection_state(connected, reason)
+        except Exception:
+            log.exception("Error in connection callback")
     
+    def _set_controls_enabled(self, connected):
+        for w in self._enable_when_connected:
+            w.setEnabled(connected)
+        for w in self._enable_when_disconnected:
+            w.setEnabled(not connected)
+
+    @Slot(bool)
     def _set_ui_connected_state(self, connected):
         """Utility method to ensure consistent UI button states.
         
         Args:
             connected: bool - whether to set connected or disconnected state
         """
-        print(f"[MainWindow] Setting UI state to {'connected' if connected else 'disconnected'}")
-        
-        if connected:
-            # Connected state
-            self.disc_act.setEnabled(True)
-            self.off_act.setEnabled(True)
-            self.vib_act.setEnabled(True)
-            self.pause_act.setEnabled(True)
-            self.scan_act.setEnabled(False)  # Can't scan while connected
-            self.record_panel.timer_btn.setEnabled(True)
-            self.record_panel.free_btn.setEnabled(True)
-        else:
-            # Disconnected state
-            self.disc_act.setEnabled(False)
-            self.off_act.setEnabled(False)
-            self.vib_act.setEnabled(False)
-            self.pause_act.setEnabled(False)
-            self.scan_act.setEnabled(True)
-            self.record_panel.timer_btn.setEnabled(False)
-            self.record_panel.free_btn.setEnabled(False)
-            
-        # Force UI update
-        from PySide6.QtWidgets import QApplication
-        QApplication.processEvents()
+        log.debug("Setting UI state to %s", "connected" if connected else "disconnected")
+        self._set_controls_enabled(connected)
         
     def _update_ui_connection_state(self, connected, reason):
         """Update UI based on connection state change.
         
-        This is called by _on_connection_changed via Qt's invokeMethod
-        to ensure UI updates happen on the main thread.
+        This is called by _apply_connection_state, which _on_connection_changed
+        queues with invokeMethod so UI updates happen on the main thread.
         """
-        print(f"[MainWindow] Updating UI connection state: connected={connected}, reason={reason}")
-        print(f"[MainWindow] Current status: '{self.status_lbl.text()}'")
+        log.debug("Updating UI connection state: connected=%s, reason=%s", connected, reason)
+        log.debug("Current status: %r", self.status_lbl.text())
         
         # First ensure button states are consistent with connection state
         # This is redundant with the earlier call in _on_connection_changed but provides extra safety
@@ -912,19 +1034,19 @@ class MainWindow(QMainWindow):
         
         if connected:
             # Always print a clear message to help with debugging
-            print(f"[MainWindow] Device connected! Updating status from '{self.status_lbl.text()}' to 'Connected'")
+            log.debug("Device connected, updating status from %r to 'Connected'", self.status_lbl.text())
             
             # Cancel any ongoing scan/connect task since we're now connected
             if self._scanning:
                 self._scanning = False
                 if self._scan_connect_task and not self._scan_connect_task.done():
-                    print("[MainWindow] Cancelling scan task as connection was established")
+                    log.debug("Cancelling scan task as connection was established")
                     self._scan_connect_task.cancel()
                     self._scan_connect_task = None
             
             # Force status update - always update when connected regardless of current text
             # This is important to ensure UI shows connected state no matter what
-            if self.status_lbl.text() in ["Connection timed out", "Operation Cancelled"]:
+            if self.status_lbl.text() in _TIMEOUT_STATES:
                 self.status_lbl.setText("Connected (succeeded after timeout)")
             else:
                 self.status_lbl.setText("Connected - Streaming data")
@@ -933,7 +1055,7 @@ class MainWindow(QMainWindow):
             QTimer.singleShot(500, self._update_mode_status)
         else:
             # Device is disconnected - update UI accordingly
-            print(f"[MainWindow] Device disconnected! Updating status from '{self.status_lbl.text()}' to 'Disconnected'")
+            log.debug("Device disconnected, updating status from %r to 'Disconnected'", self.status_lbl.text())
             
             # Reset pause state if active
             if self._paused:
@@ -941,7 +1063,7 @@ class MainWindow(QMainWindow):
                 self.pause_act.setText("Pause Stream")
             
             # Always update the status label, including if it was "Disconnecting..."
-            if self.status_lbl.text() in ["Disconnecting…", "Connecting…"]:
+            if self.status_lbl.text() in _TRANSIENT_STATES:
                 self.status_lbl.setText("Disconnected")
             else:
                 # Update status message based on reason
@@ -954,6 +1076,7 @@ class MainWindow(QMainWindow):
             self._scanning = False
 
     # ------------- connection status checker -------------------------
+    @Slot()
     def _check_connection_status(self):
         """Check the connection status and data flow periodically and update the UI accordingly.
         
@@ -965,28 +1088,33 @@ class MainWindow(QMainWindow):
         current_status = self.status_lbl.text()
         
         # Check if we're actually receiving data (battery or IMU data)
-        data_flowing = (self.myo.battery is not None) or (len(self._frame_q) > 0)
+        data_flowing = (self.myo.battery is not None) or (self._widx != self._ridx)
         
         # Track when we last saw "Disconnecting..." status
         if current_status == "Disconnecting…":
-            if not hasattr(self, "_disconnecting_start_time"):
-                self._disconnecting_start_time = time.time()
+            if self._disconnecting_start_time is None:
+                self._disconnecting_start_time = time.monotonic()
             # Allow a grace period for disconnection (2 seconds)
-            elif time.time() - self._disconnecting_start_time > 2.0:
+            elif time.monotonic() - self._disconnecting_start_time > 2.0:
                 # It's been stuck on "Disconnecting..." for too long, force an update
                 if not self.myo.connected and not data_flowing:
                     self.status_lbl.setText("Disconnected")
-                    print("[MainWindow] Status fix: UI was stuck on 'Disconnecting...' - forced update.")
+                    log.debug("Status fix: UI was stuck on 'Disconnecting…' - forced update")
                     # Reset the timer
-                    delattr(self, "_disconnecting_start_time")
+                    self._disconnecting_start_time = None
                     return
         else:
-            # Not disconnecting, clear the timer if it exists
-            if hasattr(self, "_disconnecting_start_time"):
-                delattr(self, "_disconnecting_start_time")
+            # Not disconnecting, clear the timer
+            self._disconnecting_start_time = None
         
+        # Stable and connected (the common case): nothing to fix. Covers every
+        # connected label, including _update_mode_status's "Connected | EMG: …"
+        if (current_status.startswith("Connected") and self.myo.connected
+                and self.disc_act.isEnabled() and not self.scan_act.isEnabled()):
+            return
+
         # Don't interfere with active operations
-        if current_status in ["Turning off…", "Scanning…"]:
+        if current_status in _ACTIVE_OP_STATES:
             return
         
         # Data is flowing, ensure UI shows connected
@@ -994,44 +1122,22 @@ class MainWindow(QMainWindow):
             # Verify button states regardless of current status text
             # This addresses cases where the status text is correct but buttons are wrong
             buttons_inconsistent = (
-                not self.disc_act.isEnabled() or
-                not self.off_act.isEnabled() or
-                not self.vib_act.isEnabled() or
-                not self.pause_act.isEnabled() or
-                self.scan_act.isEnabled() or
-                not self.record_panel.timer_btn.isEnabled() or
-                not self.record_panel.free_btn.isEnabled()
+                not all(w.isEnabled() for w in self._enable_when_connected) or
+                any(w.isEnabled() for w in self._enable_when_disconnected)
             )
             
             if buttons_inconsistent:
-                print("[MainWindow] Button state inconsistency detected - fixing UI controls")
+                log.debug("Button state inconsistency detected - fixing UI controls")
                 # Fix button states
-                self.disc_act.setEnabled(True)
-                self.off_act.setEnabled(True)
-                self.vib_act.setEnabled(True)
-                self.pause_act.setEnabled(True)
-                self.scan_act.setEnabled(False)
-                self.record_panel.timer_btn.setEnabled(True) 
-                self.record_panel.free_btn.setEnabled(True)
-                # Force UI update
-                from PySide6.QtWidgets import QApplication
-                QApplication.processEvents()
+                self._set_controls_enabled(True)
             
             # Also check if status text needs updating
-            if current_status in ["Connection attempt cancelled - still waiting for device", 
-                              "Connecting…", "Disconnected", "Operation Cancelled",
-                              "Connection timed out - waiting for device (may still connect)"]:
-                print(f"[MainWindow] Status fix: UI shows '{current_status}' but data is flowing. Fixing.")
+            if current_status in _STALE_CONNECTED_STATES:
+                log.debug("Status fix: UI shows %r but data is flowing", current_status)
                 self.status_lbl.setText("Connected - Streaming data")
                 
                 # Ensure buttons are enabled (redundant with above but keeping for clarity)
-                self.disc_act.setEnabled(True)
-                self.off_act.setEnabled(True)
-                self.vib_act.setEnabled(True)
-                self.pause_act.setEnabled(True)
-                self.scan_act.setEnabled(False)
-                self.record_panel.timer_btn.setEnabled(True) 
-                self.record_panel.free_btn.setEnabled(True)
+                self._set_controls_enabled(True)
                 
                 # Clear any lingering scan task
                 if self._scanning:
@@ -1043,14 +1149,8 @@ class MainWindow(QMainWindow):
         # No data flowing and not connected, ensure UI shows disconnected
         elif not data_flowing and not self.myo.connected:
             if "Connected" in current_status or "Streaming" in current_status:
-                print(f"[MainWindow] Status fix: UI shows '{current_status}' but no data flowing and disconnected. Fixing.")
+                log.debug("Status fix: UI shows %r but no data is flowing and the device is disconnected", current_status)
                 self.status_lbl.setText("Disconnected")
                 
                 # Also update UI elements
-                self.disc_act.setEnabled(False)
-                self.off_act.setEnabled(False)
-                self.vib_act.setEnabled(False)
-                self.pause_act.setEnabled(False)
-                self.scan_act.setEnabled(True)
-                self.record_panel.timer_btn.setEnabled(False)
-                self.record_panel.free_btn.setEnabled(False)
+                self._set_controls_enabled(False)
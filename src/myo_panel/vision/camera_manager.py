@@ -17,6 +17,7 @@ class CameraManager:
         self.capture = None
         self.running = False
         self.thread = None
+        self._lock = threading.Lock()  # Serialises stop() / stop_if_running()
         self.latest_frame = None
         self.latest_landmarks = None
         self.frame_width = 640
@@ -60,8 +61,12 @@ class CameraManager:
         
         self.mp_drawing = mp.solutions.drawing_utils
     
-    def get_available_cameras(self):
-        """Get a list of available cameras."""
+    def get_available_cameras(self, cancel=None):
+        """Get a list of available cameras.
+
+        *cancel* is an optional threading.Event checked between probes so a
+        caller on another thread can abort the scan early.
+        """
         cameras = []
         # Add "Default" option
         cameras.append({"id": 0, "name": "Default"})
@@ -69,6 +74,8 @@ class CameraManager:
         # Try opening the first 5 camera indices
         # This number can be adjusted based on expected maximum cameras
         for i in range(1, 5):
+            if cancel is not None and cancel.is_set():
+                break
             cap = cv2.VideoCapture(i)
             if cap.isOpened():
                 # Get camera name
@@ -140,8 +147,24 @@ class CameraManager:
             self.capture = None
             return False
     
+    def stop_if_running(self):
+        """Stop the capture if it is running; returns True if it was stopped.
+
+        The check and the stop happen under one lock, so concurrent callers
+        cannot both join the capture thread.
+        """
+        with self._lock:
+            if not self.running:
+                return False
+            self._stop_locked()
+            return True
+
     def stop(self):
         """Stop the camera capture."""
+        with self._lock:
+            self._stop_locked()
+
+    def _stop_locked(self):
         print("CameraManager: stop() called.")
         if not self.running and not self.thread and not self.capture:
             print("CameraManager: Already stopped or not started.")
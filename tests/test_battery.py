@@ -18,3 +18,14 @@ async def test_read_battery(monkeypatch):
 
     await m._read_battery()
     assert m.battery == 87
+
+def test_refresh_battery_async_calls_on_done():
+    import threading
+    m = MyoManager()
+    m._client = Dummy()
+    m._connected = True
+
+    got, done = [], threading.Event()
+    m.refresh_battery_async(lambda level: (got.append(level), done.set()))
+    assert done.wait(2.0)
+    assert got == [87]
@@ -0,0 +1,63 @@
+import os
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtCore import QThreadPool
+from PySide6.QtWidgets import QApplication
+from myo_panel.ble.myo_manager import MyoManager
+from myo_panel.ui.windows import MainWindow
+
+class RaisingCameraManager:
+    """Camera manager whose enumeration blows up like a broken cv2 backend."""
+    def get_available_cameras(self, cancel=None):
+        raise RuntimeError("VideoCapture failed")
+
+class Vision:
+    camera_manager = RaisingCameraManager()
+
+def test_failed_camera_probe_clears_probe():
+    app = QApplication.instance() or QApplication([])
+    w = MainWindow(MyoManager())
+    try:
+        w.vision_recording = Vision()
+
+        w._populate_camera_menu_if_stale()
+        assert w._cam_probe is not None
+        assert QThreadPool.globalInstance().waitForDone(2000)
+        app.processEvents()  # Deliver the queued found signal
+
+        assert w._cam_probe is None
+        assert [cam["id"] for cam in w.cam_actions] == [0]
+    finally:
+        # Let Qt tear the window down now rather than at interpreter exit
+        w.deleteLater()
+        app.processEvents()
+
+class RecordingCameraManager:
+    """Camera manager that remembers which camera it was switched to."""
+    camera_id = 0
+    def set_camera(self, camera_id):
+        self.camera_id = camera_id
+
+def test_repopulating_camera_menu_frees_stale_actions_and_follows_fallback():
+    from PySide6.QtCore import QCoreApplication, QEvent
+    from shiboken6 import isValid
+    app = QApplication.instance() or QApplication([])
+    w = MainWindow(MyoManager())
+    try:
+        w.vision_recording = Vision()
+        w.vision_recording.camera_manager = RecordingCameraManager()
+        cams = [{"id": i, "name": f"Camera {i}"} for i in range(3)]
+        w._populate_camera_menu(w._cam_menu, w._cam_group, cams)
+        chosen = w.cam_actions[2]["action"]
+        chosen.trigger()
+        assert w.vision_recording.camera_manager.camera_id == 2
+
+        w._populate_camera_menu(w._cam_menu, w._cam_group, cams[:2])
+        QCoreApplication.sendPostedEvents(None, QEvent.DeferredDelete)
+        assert not isValid(chosen)
+        assert [cam["id"] for cam in w.cam_actions] == [0, 1]
+        assert w._cam_group.checkedAction() is w.cam_actions[0]["action"]
+        assert w.vision_recording.camera_manager.camera_id == 0
+    finally:
+        w.deleteLater()
+        app.processEvents()
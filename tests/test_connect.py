@@ -0,0 +1,56 @@
+import pytest, asyncio
+from myo_panel.ble.myo_manager import MyoManager
+
+@pytest.mark.asyncio
+async def test_connect_async_maps_not_found():
+    m = MyoManager()
+    async def fail(addr, cmd):
+        raise RuntimeError("Device with address XX was not found")
+    m._connect = fail
+
+    with pytest.raises(ConnectionError, match="was not found"):
+        await m.connect_async("XX")
+
+@pytest.mark.asyncio
+async def test_scan_async_during_shutdown():
+    m = MyoManager()
+    m.request_stop()
+    assert await m.scan_async() == []
+
+@pytest.mark.asyncio
+async def test_connect_async_timeout():
+    m = MyoManager()
+    async def hang(addr, cmd):
+        await asyncio.sleep(10)
+    m._connect = hang
+
+    with pytest.raises(asyncio.TimeoutError):
+        await m.connect_async("XX", timeout=0.05)
+
+class LiveClient:
+    """Pretend-Bleak client that is connected until told otherwise."""
+    is_connected = True
+    async def disconnect(self):
+        self.is_connected = False
+
+@pytest.mark.asyncio
+async def test_connect_async_timeout_after_connected_reports_disconnect():
+    m = MyoManager()
+    events = []
+    m.set_connection_callback(lambda connected, reason: events.append((connected, reason)))
+    async def stall_after_connected(addr, cmd):
+        # Link is up and announced, then setup (battery, EMG, ...) hangs
+        m._client = LiveClient()
+        m._connected = True
+        m._connection_changed_callback(True, "connected")
+        await asyncio.sleep(10)
+    m._connect = stall_after_connected
+
+    with pytest.raises(asyncio.TimeoutError):
+        await m.connect_async("XX", timeout=0.05)
+    for _ in range(100):
+        if len(events) > 1:
+            break
+        await asyncio.sleep(0.01)
+    assert events == [(True, "connected"), (False, "disconnect")]
+    assert not m.connected
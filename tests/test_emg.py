@@ -0,0 +1,41 @@
+import pytest
+from myo_panel.ble import myo_constants as C
+from myo_panel.ble.myo_manager import MyoManager
+
+class NotifyClient:
+    """Pretend-Bleak client that keeps the notification handlers."""
+    is_connected = True
+    def __init__(self):
+        self.handlers = {}
+    async def start_notify(self, uuid, handler):
+        self.handlers[uuid] = handler
+
+PACKET = bytearray(range(-8, 8)[i] & 0xFF for i in range(16))
+
+@pytest.mark.asyncio
+async def test_emg_packet_decoded_once_for_both_consumers():
+    plotted, recorded = [], []
+    m = MyoManager(emg_frames_handler=lambda bank, frames: plotted.append((bank, frames)),
+                   emg_handler=lambda bank, frames, ts, data: recorded.append((bank, frames, data)))
+    m._client = NotifyClient()
+    await m._start_emg()
+
+    m._client.handlers[C.EMG_UUIDS[1]](None, PACKET)
+    (bank, frames), = plotted
+    assert bank == 1
+    assert frames.tolist() == [list(range(-8, 0)), list(range(0, 8))]
+    (bank, rec_frames, data), = recorded
+    assert rec_frames is frames  # Same decoded array, no second decode
+    assert data.hex() == PACKET.hex()
+
+@pytest.mark.asyncio
+async def test_emg_mode_none_skips_decoding():
+    plotted, recorded = [], []
+    m = MyoManager(emg_frames_handler=lambda *a: plotted.append(a),
+                   emg_handler=lambda bank, frames, ts, data: recorded.append(frames))
+    m._client = NotifyClient()
+    m._emg_mode = C.EMG_MODE_NONE
+    await m._start_emg()
+
+    m._client.handlers[C.EMG_UUIDS[0]](None, PACKET)
+    assert plotted == [] and recorded == [None]
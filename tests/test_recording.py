@@ -0,0 +1,74 @@
+import os, csv
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import pytest
+from PySide6.QtWidgets import QApplication
+from myo_panel.ui.recording import RecordingPanel, IMU_INITIAL_CAPACITY
+
+Q = [1.0, 0.0, 0.0, 0.0]
+A = [0.0, 0.0, 1.0]
+G = [0.1, 0.2, 0.3]
+
+@pytest.fixture
+def panel():
+    app = QApplication.instance() or QApplication([])
+    p = RecordingPanel(myo_manager=None)
+    p._start_recording()
+    yield p
+    p.deleteLater()
+    app.processEvents()
+
+def imu(panel, *samples):
+    """Push (ts, quat, acc, gyro, raw_hex) samples as one batch."""
+    panel.push_imu_batch(*zip(*samples))
+
+def test_push_imu_batch_ignored_when_not_recording(panel):
+    panel._active = False
+    imu(panel, (10, Q, A, G, "aa"))
+    assert panel._imu_n == 0
+
+def test_imu_columns_grow_past_initial_capacity(panel):
+    n = IMU_INITIAL_CAPACITY + 5
+    imu(panel, *[(t + 1, [t, 0, 0, 0], A, G, None) for t in range(n - 10)])
+    imu(panel, *[(t + 1, [t, 0, 0, 0], A, G, None) for t in range(n - 10, n)])
+    assert panel._imu_n == n
+    assert len(panel._imu_ts) >= n
+    assert panel._imu_ts[:n].tolist() == list(range(1, n + 1))
+    assert panel._imu["quat"][:n, 0].tolist() == list(range(n))
+
+def test_attach_imu_matches_by_timestamp(panel):
+    panel.push_frame([0] * 8, timestamp=5)    # before any IMU sample
+    panel.push_frame([1] * 8, timestamp=25)
+    panel.push_frame([2] * 8, timestamp=35)
+    # Out of arrival order: the sample at 30 arrives before the one at 20
+    imu(panel, (30, [3, 0, 0, 0], A, G, None))
+    imu(panel, (10, [1, 0, 0, 0], A, G, None), (20, [2, 0, 0, 0], A, G, None))
+
+    panel._attach_imu()
+    first, second, third = panel._recording
+    assert first["imu"] == {"quat": None, "acc": None, "gyro": None}
+    assert second["imu"]["quat"] == [2, 0, 0, 0]
+    assert third["imu"] == {"quat": [3, 0, 0, 0], "acc": A, "gyro": G}
+
+def test_attach_imu_missing_fields_become_none(panel):
+    imu(panel, (10, None, A, None, None))
+    panel.push_frame([0] * 8, timestamp=20)
+
+    panel._attach_imu()
+    assert panel._recording[0]["imu"] == {"quat": None, "acc": A, "gyro": None}
+
+def test_raw_rows_saved_in_timestamp_order(panel, tmp_path):
+    panel.raw_chk.setChecked(True)
+    panel.path_edit.setText(str(tmp_path))
+    panel.push_frame(None, timestamp=10, raw_hex="e1")
+    panel.push_frame(None, timestamp=30, raw_hex="e2")
+    imu(panel, (20, Q, A, G, "i1"), (40, Q, A, G, "i2"))
+
+    panel._active = False
+    panel._save_file()
+    (path,) = tmp_path.iterdir()
+    with open(path, newline="") as f:
+        rows = list(csv.reader(line for line in f if not line.startswith("#")))
+    assert rows[0] == ["timestamp", "type", "raw_hex", "label"]
+    assert [(r[0], r[1], r[2]) for r in rows[1:]] == [
+        ("10", "EMG", "e1"), ("20", "IMU", "i1"), ("30", "EMG", "e2"), ("40", "IMU", "i2")]
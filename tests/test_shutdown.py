@@ -0,0 +1,22 @@
+from myo_panel.ble.myo_manager import MyoManager
+
+class Dummy:
+    """Pretend-Bleak client that records the disconnect."""
+    is_connected = True
+    async def disconnect(self):
+        self.is_connected = False
+
+def test_request_stop_then_join():
+    m = MyoManager()
+    client = m._client = Dummy()
+    m._connected = True
+
+    m.request_stop()
+    assert not m.connected
+    assert m.join(2.0)
+    assert not client.is_connected
+    assert m._client is None
+
+def test_join_without_client():
+    m = MyoManager()
+    assert m.shutdown(timeout=0)
@@ -0,0 +1,97 @@
+import os
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import numpy as np
+import pytest
+from PySide6.QtWidgets import QApplication
+from myo_panel.ble.myo_manager import MyoManager
+from myo_panel.ui.windows import MainWindow, EMG_QUEUE_LEN
+
+@pytest.fixture
+def win():
+    app = QApplication.instance() or QApplication([])
+    w = MainWindow(MyoManager())
+    yield w
+    # Let Qt tear the window down now rather than at interpreter exit
+    w.deleteLater()
+    app.processEvents()
+
+class Untouchable:
+    """Stands in for a control tuple the fast path must not walk."""
+    def __iter__(self):
+        raise AssertionError("full connection check ran")
+
+def test_status_check_fast_path_for_mode_status(win):
+    win.myo._connected = True
+    win.myo._battery = 80  # Data is flowing
+    win._set_controls_enabled(True)
+    win.status_lbl.setText("Connected | EMG: Raw | IMU: Data")
+    win._enable_when_connected = win._enable_when_disconnected = Untouchable()
+
+    win._check_connection_status()
+    assert win.status_lbl.text() == "Connected | EMG: Raw | IMU: Data"
+
+def test_status_check_still_fixes_dead_link(win):
+    win._set_controls_enabled(True)
+    win.status_lbl.setText("Connected | EMG: Raw | IMU: Data")
+
+    win._check_connection_status()  # myo reports disconnected
+    assert win.status_lbl.text() == "Disconnected"
+    assert not win.disc_act.isEnabled() and win.scan_act.isEnabled()
+
+# ── mirrored EMG frame ring ──────────────────────────────────────────
+def packet(k):
+    """16-byte EMG notification carrying frames k and k + 1."""
+    rows = (np.arange(k, k + 2)[:, None] * 3 + np.arange(8)) % 256 - 128
+    return rows.astype(np.int8).tobytes()
+
+def feed(win, start, n_frames):
+    for k in range(start, start + n_frames, 2):
+        win.on_emg_frames(0, np.frombuffer(packet(k), dtype=np.int8).reshape(2, 8))
+
+def expected(start, n_frames):
+    return np.concatenate([np.frombuffer(packet(k), dtype=np.int8).reshape(2, 8)
+                           for k in range(start, start + n_frames, 2)])
+
+@pytest.fixture
+def plotted(win):
+    """Frames handed to the visible view, one (N, 8) array per refresh."""
+    got = []
+    win.grid_view.push_and_refresh = lambda frames: got.append(frames.T.copy())
+    return got
+
+def test_ring_delivers_frames_in_order_across_wrap(win, plotted):
+    k = 0
+    while k < 3 * EMG_QUEUE_LEN:
+        feed(win, k, 60)
+        win._refresh_plots()
+        k += 60
+    assert np.array_equal(np.concatenate(plotted), expected(0, k))
+    assert win._ridx == win._widx == k
+
+def test_ring_caps_catch_up_at_half_the_queue(win, plotted):
+    feed(win, 0, 400)
+    win._refresh_plots()
+    (frames,) = plotted
+    assert np.array_equal(frames, expected(400 - EMG_QUEUE_LEN // 2, EMG_QUEUE_LEN // 2))
+    assert win._ridx == win._widx == 400
+
+def test_ring_ignores_frames_while_paused(win, plotted):
+    win._paused = True
+    feed(win, 0, 40)
+    win._refresh_plots()
+    assert win._widx == 0 and plotted == []
+
+def test_emg_ready_rearms_after_drain(win, plotted):
+    signals = []
+    win.emg_ready.connect(lambda: signals.append(win._widx))
+    chunk = win._emg_chunk
+    feed(win, 0, chunk - 2)
+    assert signals == []               # Not a refresh's worth yet
+    feed(win, chunk - 2, chunk + 2)
+    assert signals == [chunk]          # One wake-up in flight, no repeats
+    win._refresh_plots()
+    feed(win, 2 * chunk, chunk - 2)
+    assert signals == [chunk]          # Re-armed, but not a refresh's worth yet
+    feed(win, 3 * chunk - 2, 2)
+    assert signals == [chunk, 3 * chunk]